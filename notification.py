@@ -2,6 +2,7 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "orjson",
 #     "python-dotenv",
 # ]
 # ///
@@ -9,51 +10,40 @@
 import json
 import os
 import sys
-import subprocess
 import random
 from pathlib import Path
 from datetime import datetime
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv(Path.home() / '.env')
+    # Skip the .env parse when the hook runner already exported the keys we
+    # care about (the typical deployed case)
+    if not any(k in os.environ for k in (
+            'ELEVENLABS_API_KEY', 'OPENAI_API_KEY',
+            'CLAUDE_RESPONSE_SUMMARY_ENABLED', 'ENGINEER_NAME')):
+        from dotenv import load_dotenv
+        load_dotenv(Path.home() / '.env')
 except ImportError:
     pass  # dotenv is optional
 
+try:
+    import orjson  # ~3-10x faster parse than stdlib json
+except ImportError:
+    orjson = None  # orjson is optional
+
+# Utils are imported lazily inside announce_notification() so the generic
+# skip-message invocations never pay for parsing them
+UTILS_DIR = str(Path(__file__).parent / "utils")
+
 
 def get_tts_script_path():
     """
     Get the cached TTS script path.
     Uses cached audio files when available to save API costs and reduce latency.
     """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-
-    # Use cached TTS wrapper (supports all TTS backends with caching)
-    cached_tts_script = tts_dir / "cached_tts.py"
-    if cached_tts_script.exists():
-        return str(cached_tts_script)
-
-    # Fallback to non-cached scripts if cached_tts doesn't exist
-    # Check for ElevenLabs API key (highest priority)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-
-    # Check for OpenAI API key (second priority)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-
-    # Fall back to system voice (no API key required)
-    system_voice_script = tts_dir / "system_voice_tts.py"
-    if system_voice_script.exists():
-        return str(system_voice_script)
-
-    return None
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from tts_resolve import resolve_tts_script
+    return resolve_tts_script(prefer_cached=True)
 
 
 def announce_notification():
@@ -68,6 +58,13 @@ def announce_notification():
     }
 
     try:
+        # Lazy imports: only real notifications pay for the utils modules
+        if UTILS_DIR not in sys.path:
+            sys.path.insert(0, UTILS_DIR)
+        from spawn import spawn_detached
+        from tts_client import send_to_tts_daemon, start_tts_daemon
+        from tts_resolve import tts_argv
+
         tts_script = get_tts_script_path()
         if not tts_script:
             return tts_metadata  # No TTS scripts available
@@ -77,35 +74,63 @@ def announce_notification():
         if not engineer_name:
             engineer_name = os.getenv('USER', '').strip()
 
-        # Create notification message with 30% chance to include name
-        personalized = engineer_name and random.random() < 0.3
-        if personalized:
-            notification_message = f"{engineer_name}, your agent needs your input"
-        else:
-            notification_message = "Your agent needs your input"
+        # Create notification message with 30% chance to include name.
+        # Branchless: index a 2-tuple by the boolean instead of branching,
+        # and compare 8 random bits against 77 (0.3 * 256) to skip the
+        # float conversion in random.random().
+        messages = (
+            "Your agent needs your input",
+            f"{engineer_name}, your agent needs your input",
+        )
+        personalized = bool(engineer_name) and random.getrandbits(8) < 77
+        notification_message = messages[personalized]
 
         tts_metadata["message"] = notification_message
         tts_metadata["personalized"] = personalized
         tts_metadata["tts_triggered"] = True
 
-        # Fire-and-forget: spawn TTS in background, don't wait for completion
-        subprocess.Popen(
-            [sys.executable, tts_script, notification_message],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True  # Detach from parent process
-        )
-
-    except (FileNotFoundError, subprocess.SubprocessError, Exception) as e:
+        # Warm path: hand the message to the persistent TTS daemon - a
+        # single sendto, no fork or interpreter startup
+        if not send_to_tts_daemon(notification_message):
+            # Fire-and-forget: spawn TTS in background, don't wait for
+            # completion. posix_spawn avoids the fork page-table copy that
+            # Popen would pay, and exec'ing the script directly (uv shebang)
+            # skips a second CPython startup.
+            spawn_detached(tts_argv(tts_script, notification_message))
+            # Warm the daemon for the next invocation
+            start_tts_daemon()
+
+    except Exception as e:
         tts_metadata["error"] = f"TTS spawn error: {type(e).__name__}"
 
     return tts_metadata
 
 
+def _exit_fast():
+    """Exit without interpreter teardown (atexit, stdio unwind, final GC).
+
+    The hook holds no open sockets or handles and the TTS child is already
+    detached, so skipping cleanup shaves a few ms off every invocation.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
 def main():
     try:
-        # Read JSON input from stdin
-        input_data = json.loads(sys.stdin.read())
+        # Read the raw input bytes and short-circuit on the generic
+        # "Claude is waiting for your input" message before paying the JSON
+        # parse - the skip path is the common case
+        raw = sys.stdin.buffer.read()
+        if b'"Claude is waiting for your input"' in raw:
+            _exit_fast()
+
+        # Parse JSON input (orjson parses the raw bytes directly)
+        if orjson is not None:
+            input_data = orjson.loads(raw)
+        else:
+            input_data = json.loads(raw)
 
         # Announce notification via TTS
         # Skip TTS for the generic "Claude is waiting for your input" message
@@ -125,12 +150,12 @@ def main():
         #     json.dump(input_data, f)
         #     f.write('\n')
 
-        sys.exit(0)
+        _exit_fast()
 
     except json.JSONDecodeError:
-        sys.exit(0)  # Fail gracefully on JSON errors
+        _exit_fast()  # Fail gracefully on JSON errors
     except Exception:
-        sys.exit(0)  # Fail gracefully on any errors
+        _exit_fast()  # Fail gracefully on any errors
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
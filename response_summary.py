@@ -2,28 +2,96 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "orjson",
 #     "python-dotenv",
 # ]
 # ///
 
+import functools
+import hashlib
 import json
 import os
 import sys
-import subprocess
-import signal
 import fcntl
 from pathlib import Path
-from datetime import datetime
+
+# subprocess, signal and datetime are imported lazily at their use sites;
+# the disabled-path invocation (the common case) never pays for loading them
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv(Path.home() / '.env')
+    # Skip the .env parse when the hook runner already exported the keys we
+    # care about (the typical deployed case)
+    if not any(k in os.environ for k in (
+            'ELEVENLABS_API_KEY', 'OPENAI_API_KEY',
+            'CLAUDE_RESPONSE_SUMMARY_ENABLED', 'ENGINEER_NAME')):
+        from dotenv import load_dotenv
+        load_dotenv(Path.home() / '.env')
 except ImportError:
     pass  # dotenv is optional
 
-# Import utilities
-sys.path.insert(0, str(Path(__file__).parent / "utils"))
-from transcript import get_combined_response
+try:
+    import orjson  # ~3-10x faster parse/serialize than stdlib json
+except ImportError:
+    orjson = None  # orjson is optional
+
+# All derived paths come from one module-level constant; nothing recomputes
+# Path(__file__).parent per call
+SCRIPT_DIR = Path(__file__).parent
+
+# Utils are imported lazily inside summarize_and_announce() so the frequent
+# no-op invocations (feature disabled, no transcript path) never pay for
+# parsing them. main() performs its early-exit checks before any heavy import.
+UTILS_DIR = str(SCRIPT_DIR / "utils")
+
+# Summarizer location precomputed once; os.path.exists on a plain string
+# skips the per-call Path construction
+LLM_DIR = SCRIPT_DIR / "utils" / "llm"
+SUMMARIZER_SCRIPT = str(LLM_DIR / "summarizer.py")
+SUMMARIZER_DAEMON_SCRIPT = str(LLM_DIR / "summarizer_daemon.py")
+
+def _summarizer_socket_path():
+    """The summarizer daemon's socket (in the user's private runtime dir)."""
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from runtime import get_runtime_dir
+    return str(get_runtime_dir() / 'summarizer.sock')
+
+
+def _summarize_via_daemon(text: str, timeout: int = 10):
+    """Ask the persistent summarizer daemon for a summary.
+
+    Returns:
+        str or None: The summary, or None when the daemon isn't running or
+            produced nothing (caller falls back to the in-process path)
+    """
+    import socket
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(_summarizer_socket_path())
+        sock.sendall(text.encode('utf-8') + b'\n')
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks).decode('utf-8', errors='replace').strip() or None
+    except OSError:
+        return None
+    finally:
+        sock.close()
+
+
+def _start_summarizer_daemon():
+    """Spawn the summarizer daemon detached so future hooks get warm calls."""
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from spawn import spawn_detached
+    try:
+        spawn_detached([SUMMARIZER_DAEMON_SCRIPT])
+    except OSError:
+        pass  # No daemon; the in-process path keeps working
 
 
 def sanitize_text(text: str, max_length: int = 50000) -> str:
@@ -50,60 +118,426 @@ def sanitize_text(text: str, max_length: int = 50000) -> str:
     return text
 
 
+def first_words(text: str, count: int = 10) -> str:
+    """First `count` whitespace-separated words of text.
+
+    Scans only as far as needed - a 50KB response costs ~the first 100
+    bytes, not a full tokenize (split(maxsplit=N) still copies the tail
+    as its final element).
+    """
+    import itertools
+    import re
+    return ' '.join(itertools.islice(
+        (m.group() for m in re.finditer(r'\S+', text)), count))
+
+
+# Hook-start notification sound. The stock .oga needs a heavyweight player
+# (paplay/ffplay); a one-time background ffmpeg decode to WAV lets later
+# invocations spawn the tiny aplay binary instead.
+NOTIFY_SOUND = '/usr/share/sounds/freedesktop/stereo/message-new-instant.oga'
+NOTIFY_WAV = Path.home() / '.cache' / 'claude-speaks' / 'notify.wav'
+
+# libcanberra handle + context, loaded once per process
+_canberra = None
+_canberra_ctx = None
+
+
+def _play_beep_canberra():
+    """Play the event sound in-process via libcanberra.
+
+    One library call plus sound-server IPC - no fork, no exec, no decoder
+    process. Returns False when libcanberra isn't available so callers can
+    fall back to spawning a player.
+    """
+    global _canberra, _canberra_ctx
+    import ctypes
+    try:
+        if _canberra is None:
+            _canberra = ctypes.CDLL('libcanberra.so.0')
+        if _canberra_ctx is None:
+            ctx = ctypes.c_void_p()
+            if _canberra.ca_context_create(ctypes.byref(ctx)) != 0:
+                return False
+            _canberra_ctx = ctx
+        rc = _canberra.ca_context_play(
+            _canberra_ctx, 0,
+            b'event.id', b'message-new-instant',
+            None)
+        return rc == 0
+    except OSError:
+        return False
+
+
+def play_start_notification(spawn_detached):
+    """Play the hook-start beep without blocking.
+
+    Cheapest path first: a single datagram to the TTS daemon, which forks
+    the player on our behalf. Otherwise uses the pre-decoded WAV via aplay
+    when available, falling back to paplay on the .oga while kicking off
+    the decode for next time.
+    """
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from tts_client import send_to_tts_daemon
+    if send_to_tts_daemon('__BEEP__'):
+        return
+
+    # In-process library call: cheaper than any spawn
+    if _play_beep_canberra():
+        return
+
+    if NOTIFY_WAV.exists():
+        spawn_detached(['aplay', '-q', str(NOTIFY_WAV)])
+        return
+
+    try:
+        spawn_detached(['paplay', NOTIFY_SOUND])
+    except OSError:
+        pass  # No paplay; the decoded WAV below covers future invocations
+
+    # Pre-decode in the background for future invocations (atomic rename so
+    # a half-written file is never picked up)
+    try:
+        import shlex
+        NOTIFY_WAV.parent.mkdir(parents=True, exist_ok=True)
+        tmp_wav = NOTIFY_WAV.with_suffix(f'.{os.getpid()}.tmp.wav')
+        spawn_detached([
+            'sh', '-c',
+            f'ffmpeg -y -loglevel quiet -i {shlex.quote(NOTIFY_SOUND)} '
+            f'{shlex.quote(str(tmp_wav))} && '
+            f'mv {shlex.quote(str(tmp_wav))} {shlex.quote(str(NOTIFY_WAV))} '
+            f'|| rm -f {shlex.quote(str(tmp_wav))}'
+        ])
+    except OSError:
+        pass  # Decode failure is non-critical; paplay keeps working
+
+
+# Content-hash cache of LLM summaries. Identical responses (retries, short
+# repeated endings) skip the summarizer subprocess and its 10s tail latency.
+SUMMARY_CACHE_DIR = Path.home() / '.cache' / 'claude-speaks' / 'summaries'
+
+# Cached summaries older than this are treated as misses and regenerated
+SUMMARY_CACHE_TTL_S = 7 * 24 * 3600
+
+
+def get_cached_summary(response_text: str):
+    """Look up a previously generated summary by response content hash.
+
+    Entries past the 7-day TTL count as misses so stale phrasing doesn't
+    live forever.
+
+    Returns:
+        tuple: (cache_key: str, summary: str or None)
+    """
+    import time
+    key = hashlib.blake2b(response_text.encode('utf-8'), digest_size=16).hexdigest()
+    cache_path = SUMMARY_CACHE_DIR / f"{key}.txt"
+    try:
+        if time.time() - cache_path.stat().st_mtime > SUMMARY_CACHE_TTL_S:
+            return key, None
+        return key, cache_path.read_text().strip() or None
+    except OSError:
+        return key, None
+
+
+def store_cached_summary(cache_key: str, summary: str):
+    """Persist a successful LLM summary atomically (torn writes recover as miss)."""
+    try:
+        SUMMARY_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_path = SUMMARY_CACHE_DIR / f"{cache_key}.txt"
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(summary)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Cache write failure is non-critical
+
+
+# Queue for hook invocations that lose the instance lock: instead of being
+# dropped, their transcripts are announced in one batched utterance by the
+# lock holder after its own run. It lives in the private runtime dir the
+# daemon sockets use, so no other user can pre-create or read it.
+
+
+def _queue_file():
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from runtime import get_runtime_dir
+    return get_runtime_dir() / 'summary_queue.ndjson'
+
+
+def enqueue_for_batch(transcript_path: str):
+    """Late arrival: leave our transcript for the lock holder to announce."""
+    try:
+        if orjson is not None:
+            line = orjson.dumps({'transcript_path': transcript_path}) + b'\n'
+        else:
+            line = (json.dumps({'transcript_path': transcript_path}) + '\n').encode('utf-8')
+        queue_file = _queue_file()  # Also puts utils on sys.path
+        from runtime import ensure_runtime_dir
+        ensure_runtime_dir()
+        fd = os.open(queue_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        try:
+            os.write(fd, line)  # O_APPEND: atomic on POSIX
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Best effort; the announcement is simply skipped
+
+
+def drain_summary_queue(primary_transcript_path: str):
+    """Speak one batched announcement for arrivals queued during our run.
+
+    Returns:
+        int: Number of queued transcripts merged into the batch
+    """
+    queue_file = _queue_file()
+    try:
+        with open(queue_file, 'rb') as f:
+            lines = f.readlines()
+    except OSError:
+        return 0  # Nothing queued
+
+    # Remove (or at least empty) the queue before announcing, so a failed
+    # unlink can't replay the same entries on every future drain
+    try:
+        os.unlink(queue_file)
+    except OSError:
+        try:
+            os.truncate(queue_file, 0)
+        except OSError:
+            pass
+
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from transcript import get_combined_response
+    from spawn import spawn_detached
+    from tts_resolve import tts_argv
+
+    texts = []
+    seen = {primary_transcript_path}
+    for line in lines:
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        queued_path = entry.get('transcript_path')
+        if not queued_path or queued_path in seen:
+            continue
+        seen.add(queued_path)
+        text = get_combined_response(queued_path)
+        if text:
+            texts.append(text)
+
+    if not texts:
+        return 0
+
+    # One summarizer call and one utterance for the whole batch
+    combined = sanitize_text('\n\n'.join(texts))
+    summary = _summarize_via_daemon(combined, timeout=10)
+    if summary is None:
+        try:
+            summary = _run_summarizer_inprocess(combined, timeout=10)
+        except TimeoutError:
+            summary = None
+    if not summary:
+        summary = first_words(combined)
+
+    tts_script = get_tts_script_path()
+    if tts_script:
+        try:
+            spawn_detached(tts_argv(tts_script, sanitize_text(summary, max_length=500)))
+        except OSError:
+            pass
+
+    return len(texts)
+
+
+# Last summarized response + its summary. When the next response merely
+# extends the previous one, only the prior summary plus the new tail goes to
+# the LLM, keeping the provider's prompt cache hot and the payload small.
+SUMMARY_STATE_FILE = Path('/tmp/claude_response_summary.state.json')
+
+
+def read_summary_state():
+    """Load the previous (response, summary) pair, or None."""
+    try:
+        with open(SUMMARY_STATE_FILE) as f:
+            state = json.load(f)
+        if isinstance(state, dict) and 'response' in state and 'summary' in state:
+            return state
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def store_summary_state(response_text: str, summary: str):
+    """Persist the (response, summary) pair atomically for the next run."""
+    try:
+        tmp_path = SUMMARY_STATE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        # 0600: the state carries conversation content and /tmp is shared
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'response': response_text, 'summary': summary}, f)
+        os.replace(tmp_path, SUMMARY_STATE_FILE)
+    except OSError:
+        pass  # State write failure is non-critical
+
+
+# Accepted truthy spellings for boolean env flags; a frozenset global gives
+# an O(1) hashed lookup with no per-call tuple allocation
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 'y'})
+
 # Debug logging configuration
-DEBUG_ENABLED = os.getenv('RESPONSE_SUMMARY_DEBUG', 'false').lower() in ('true', '1', 'yes')
+DEBUG_ENABLED = os.environ.get('RESPONSE_SUMMARY_DEBUG', '').lower() in _TRUTHY
 DEBUG_LOG = Path('/tmp/response_summary_debug.log')
 
-def debug_log(message: str, data: dict = None):
-    """Log debug information if debugging is enabled."""
-    if not DEBUG_ENABLED:
-        return
+# Debug records are buffered in memory and flushed in one write at exit, so
+# the hot path pays a list append per record instead of file I/O
+_debug_buffer = []
+
+def _debug_log_impl(message: str, data=None):
+    """Log debug information (only bound when debugging is enabled).
 
+    `data` may be a dict or a zero-arg callable returning one; callables
+    let call sites defer syscalls (getcwd etc.) and dict building to
+    debug-enabled runs only.
+    """
+    import time
+    if callable(data):
+        data = data()
+    _debug_buffer.append((time.time_ns(), message, data))
+
+
+def _flush_debug():
+    """Format and write all buffered debug records in a single append."""
+    if not _debug_buffer:
+        return
     try:
+        from datetime import datetime
+
         # Create log file with restrictive permissions on first write
         if not DEBUG_LOG.exists():
             DEBUG_LOG.touch(mode=0o600)  # Owner read/write only
 
-        with open(DEBUG_LOG, 'a') as f:
-            timestamp = datetime.now().isoformat()
-            f.write(f"[{timestamp}] {message}\n")
+        lines = []
+        for ts_ns, message, data in _debug_buffer:
+            timestamp = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+            lines.append(f"[{timestamp}] {message}\n")
             if data:
                 for key, value in data.items():
-                    # Truncate large values to prevent log bloat
-                    if isinstance(value, str) and len(value) > 500:
+                    # Truncate large values to prevent log bloat. Bytes are
+                    # sliced through a memoryview first so only the kept 500
+                    # bytes get copied and decoded.
+                    if isinstance(value, (bytes, bytearray)):
+                        truncated = len(value) > 500
+                        value = bytes(memoryview(value)[:500]).decode(errors='replace')
+                        if truncated:
+                            value += "... (truncated)"
+                    elif isinstance(value, str) and len(value) > 500:
                         value = value[:500] + "... (truncated)"
-                    f.write(f"  {key}: {value}\n")
-            f.write("\n")
+                    lines.append(f"  {key}: {value}\n")
+            lines.append("\n")
+        _debug_buffer.clear()
+
+        with open(DEBUG_LOG, 'a') as f:
+            f.write(''.join(lines))
     except Exception:
         pass  # Fail silently on logging errors
 
 
+if DEBUG_ENABLED:
+    # os._exit in _exit_fast skips atexit, so that path flushes explicitly;
+    # this covers abnormal exits
+    import atexit
+    atexit.register(_flush_debug)
+
+
+def _debug_log_noop(message: str, data=None):
+    """No-op stand-in so the production path pays no debug overhead."""
+
+
+# Bind once at module load; the hot path never re-checks the env var
+debug_log = _debug_log_impl if DEBUG_ENABLED else _debug_log_noop
+
+
+@functools.lru_cache(maxsize=None)
 def get_tts_script_path():
     """
     Get the TTS script path for summaries.
     Priority: OpenAI > ElevenLabs > system voice
+
+    The result is invariant for the process lifetime, so it is memoized;
+    only the first call touches the resolver at all.
     """
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-
-    # Check for OpenAI API key (fastest and cheapest)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-
-    # Fallback to ElevenLabs (highest quality)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-
-    # Fallback to system voice (free, no API key required)
-    system_voice_script = tts_dir / "system_voice_tts.py"
-    if system_voice_script.exists():
-        return str(system_voice_script)
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from tts_resolve import resolve_tts_script
+    return resolve_tts_script(prefer_cached=False)
 
-    return None
+
+def _run_summarizer_inprocess(text: str, timeout: int = 10):
+    """Summarize by importing the summarizer module directly.
+
+    Skips the subprocess fork + interpreter startup the script invocation
+    paid per hook. A SIGALRM timer preserves the timeout semantics.
+
+    Args:
+        text: Response text to summarize
+        timeout: Seconds before TimeoutError is raised
+
+    Returns:
+        str or None: The summary, or None if the summarizer produced nothing
+
+    Raises:
+        TimeoutError: If summarization exceeds the timeout
+    """
+    import signal
+
+    if str(LLM_DIR) not in sys.path:
+        sys.path.insert(0, str(LLM_DIR))
+    try:
+        from summarizer import summarize_response
+    except Exception:
+        return None  # Missing LLM deps; caller falls back to simple summary
+
+    def _on_alarm(signum, frame):
+        raise TimeoutError("summarizer timed out")
+
+    old_handler = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        summary = summarize_response(text)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+    return summary.strip() if summary else None
+
+
+def _wait_for_exit(process, timeout):
+    """Wait for a subprocess to exit using pidfd + epoll.
+
+    Avoids the helper thread subprocess.communicate spins up for its
+    timeout handling: one epoll_wait on the process fd does the job.
+
+    Returns:
+        bool or None: True if the process exited within the timeout, False
+            on timeout, None when pidfd is unavailable (caller should fall
+            back to communicate's own timeout)
+    """
+    import selectors
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        return None  # Pre-5.3 kernel or unsupported platform
+    try:
+        sel = selectors.DefaultSelector()
+        sel.register(pidfd, selectors.EVENT_READ)
+        ready = sel.select(timeout)
+        sel.close()
+        return bool(ready)
+    finally:
+        os.close(pidfd)
 
 
 def summarize_and_announce(transcript_path: str):
@@ -116,23 +550,42 @@ def summarize_and_announce(transcript_path: str):
     Returns:
         dict: Metadata about the operation
     """
-    debug_log("=== SUMMARIZE AND ANNOUNCE STARTED ===", {
+    debug_log("=== SUMMARIZE AND ANNOUNCE STARTED ===", lambda: {
         "transcript_path": transcript_path,
         "cwd": os.getcwd()
     })
 
-    # Play instant notification sound (non-blocking) to indicate hook started
+    # Lazy imports: utils and the heavier stdlib modules are only parsed once
+    # the hook is actually going to do work (see the early-exit checks in
+    # main())
+    import signal
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
+    from transcript import get_combined_response
+    from spawn import spawn_detached
+
+    # Overlap the independent startup work: the hook-start beep, the
+    # transcript read and (later) the TTS path resolution have no ordering
+    # dependency, so they run on a small pool instead of serially
+    pool = ThreadPoolExecutor(max_workers=2)
+
+    # Play instant notification sound (non-blocking) to indicate hook
+    # started. Inline, not pooled: every path inside is fire-and-forget
+    # (daemon datagram / libcanberra call / detached spawn), and a pooled
+    # beep could be killed by _exit_fast on the early-exit paths before it
+    # ever fired.
     try:
         debug_log("Playing start notification")
-        subprocess.Popen(
-            ['paplay', '/usr/share/sounds/freedesktop/stereo/message-new-instant.oga'],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL
-        )
+        play_start_notification(spawn_detached)
         debug_log("Start notification spawned")
     except Exception as e:
         debug_log("Start notification failed", {"error": str(e)})
 
+    # Kick off the transcript read concurrently with the rest of the setup
+    response_future = pool.submit(get_combined_response, transcript_path)
+
     metadata = {
         "tts_triggered": False,
         "summary": None,
@@ -142,10 +595,10 @@ def summarize_and_announce(transcript_path: str):
     }
 
     try:
-        # Extract Claude's latest response from transcript
+        # Collect Claude's latest response from the concurrent read
         debug_log("Extracting response from transcript")
-        response_text = get_combined_response(transcript_path)
-        debug_log("Response extraction complete", {
+        response_text = response_future.result()
+        debug_log("Response extraction complete", lambda: {
             "response_length": len(response_text) if response_text else 0,
             "response_preview": response_text[:100] if response_text else "None"
         })
@@ -158,69 +611,122 @@ def summarize_and_announce(transcript_path: str):
         metadata["response_found"] = True
         debug_log("Response found successfully")
 
-        # Summarize the response
-        llm_dir = Path(__file__).parent / "utils" / "llm"
-        summarizer_script = llm_dir / "summarizer.py"
+        # Simple fallback computed once: first 10 words, scanned lazily so a
+        # multi-KB response isn't tokenized past what we keep
+        simple_summary = first_words(response_text)
+
+        # Short responses are spoken verbatim; the LLM round-trip costs more
+        # than it saves under ~20 words (bounded split, no full tokenize)
+        is_short = len(response_text.split(maxsplit=20)) <= 20
+
+        # Check the content-hash cache before paying an LLM round-trip
+        cache_key, cached_summary = (None, None) if is_short else get_cached_summary(response_text)
+
+        # Prefetch the TTS path while the summarizer runs
+        tts_path_future = pool.submit(get_tts_script_path)
 
+        # Summarize the response
+        summarizer_exists = os.path.exists(SUMMARIZER_SCRIPT)
         debug_log("Checking for summarizer script", {
-            "llm_dir": str(llm_dir),
-            "summarizer_script": str(summarizer_script),
-            "exists": summarizer_script.exists()
+            "llm_dir": str(LLM_DIR),
+            "summarizer_script": SUMMARIZER_SCRIPT,
+            "exists": summarizer_exists
         })
 
-        if summarizer_script.exists():
+        if is_short:
+            summary = response_text.strip()
+            metadata["summary"] = summary
+            metadata["summary_method"] = "short_circuit"
+            debug_log("Short response, speaking directly", {"summary": summary})
+        elif cached_summary:
+            summary = cached_summary
+            metadata["summary"] = summary
+            metadata["summary_method"] = "cache"
+            debug_log("Using cached summary", {"summary": summary})
+        elif summarizer_exists:
+            # In-process call by default; the subprocess path stays available
+            # for debugging via CLAUDE_SUMMARIZER_SUBPROCESS
+            use_subprocess = os.environ.get('CLAUDE_SUMMARIZER_SUBPROCESS', '').lower() in _TRUTHY
             try:
-                # Sanitize input before passing to subprocess
-                sanitized_response = sanitize_text(response_text)
+                # When the response merely extends the previous one, send the
+                # prior summary plus the new tail instead of the whole text
+                summarizer_input = response_text
+                prior_state = read_summary_state()
+                if (prior_state
+                        and len(response_text) > len(prior_state['response'])
+                        and response_text.startswith(prior_state['response'])):
+                    delta = response_text[len(prior_state['response']):]
+                    summarizer_input = (
+                        f"Earlier summary: {prior_state['summary']}\n\n"
+                        f"New content since then:\n{delta}"
+                    )
+                    debug_log("Delta summarization", {
+                        "delta_length": len(delta),
+                        "prior_summary": prior_state['summary']
+                    })
+
+                # Sanitize input before handing to the summarizer
+                sanitized_response = sanitize_text(summarizer_input)
 
                 debug_log("Calling LLM summarizer", {
                     "timeout": 10,
+                    "in_process": not use_subprocess,
                     "response_preview": response_text[:100]
                 })
-                # Call summarizer with 10 second timeout (execute directly to use uv shebang)
-                result = subprocess.run(
-                    [str(summarizer_script), sanitized_response],
-                    capture_output=True,
-                    text=True,
-                    timeout=10
-                )
-
-                debug_log("LLM summarizer completed", {
-                    "returncode": result.returncode,
-                    "stdout": result.stdout[:200],
-                    "stderr": result.stderr[:200]
-                })
+                if use_subprocess:
+                    # Call summarizer with 10 second timeout (execute directly to use uv shebang)
+                    result = subprocess.run(
+                        [SUMMARIZER_SCRIPT, sanitized_response],
+                        capture_output=True,
+                        text=True,
+                        timeout=10
+                    )
+
+                    debug_log("LLM summarizer completed", {
+                        "returncode": result.returncode,
+                        "stdout": result.stdout[:200],
+                        "stderr": result.stderr[:200]
+                    })
 
-                if result.returncode == 0 and result.stdout.strip():
-                    summary = result.stdout.strip()
+                    llm_summary = result.stdout.strip() if result.returncode == 0 else None
+                else:
+                    # Warm path: persistent daemon with initialized clients
+                    llm_summary = _summarize_via_daemon(sanitized_response, timeout=10)
+                    if llm_summary is None:
+                        llm_summary = _run_summarizer_inprocess(sanitized_response, timeout=10)
+                        # Warm the daemon for the next invocation
+                        _start_summarizer_daemon()
+                    debug_log("LLM summarizer completed", {"summary": llm_summary})
+
+                if llm_summary:
+                    summary = llm_summary
                     metadata["summary"] = summary
                     metadata["summary_method"] = "llm"
+                    store_cached_summary(cache_key, summary)
+                    store_summary_state(response_text, summary)
                     debug_log("Using LLM summary", {"summary": summary})
                 else:
                     # Fallback: use first 10 words
-                    words = response_text.split()[:10]
-                    summary = ' '.join(words)
+                    summary = simple_summary
                     metadata["summary"] = summary
                     metadata["summary_method"] = "simple_fallback"
                     debug_log("Using simple fallback (LLM failed)", {"summary": summary})
 
-            except subprocess.TimeoutExpired as e:
+            except (subprocess.TimeoutExpired, TimeoutError):
                 # LLM timeout - use simple fallback
-                words = response_text.split()[:10]
-                summary = ' '.join(words)
+                summary = simple_summary
                 metadata["summary"] = summary
                 metadata["summary_method"] = "timeout_fallback"
                 debug_log("Using timeout fallback", {"summary": summary})
         else:
             # No summarizer - use simple fallback
-            words = response_text.split()[:10]
-            summary = ' '.join(words)
+            summary = simple_summary
             metadata["summary"] = summary
             metadata["summary_method"] = "no_summarizer"
             debug_log("No summarizer script found, using fallback", {"summary": summary})
 
         # Speak the summary via TTS (detached process survives hook exit)
-        tts_script = get_tts_script_path()
+        tts_script = tts_path_future.result()
 
         debug_log("Getting TTS script", {
             "tts_script": str(tts_script) if tts_script else "None",
@@ -234,8 +740,7 @@ def summarize_and_announce(transcript_path: str):
                 # Sanitize summary before passing to subprocess
                 sanitized_summary = sanitize_text(summary, max_length=500)
 
-                debug_log("Running TTS synchronously", {
-                    "executable": sys.executable,
+                debug_log("Running TTS synchronously", lambda: {
                     "script": tts_script,
                     "summary": summary
                 })
@@ -260,24 +765,42 @@ def summarize_and_announce(transcript_path: str):
                     safe_env['OPENAI_TTS_DEBUG'] = os.getenv('OPENAI_TTS_DEBUG', 'false')
 
                 # Use Popen with process group to ensure child processes (mpg123) are killed on timeout
+                from tts_resolve import tts_argv
                 process = subprocess.Popen(
-                    [tts_script, sanitized_summary],
+                    tts_argv(tts_script, sanitized_summary),
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     env=safe_env,
-                    start_new_session=True  # Create new process group
+                    # New process group for killpg; unlike start_new_session,
+                    # process_group keeps CPython on its posix_spawn fast
+                    # path (no fork page-table copy)
+                    process_group=0
                 )
 
-                try:
-                    stdout, stderr = process.communicate(timeout=15)
+                # Wait on the process fd instead of communicate(timeout=...),
+                # which spins up a helper thread for its timeout handling
+                stdout = stderr = None
+                exited = _wait_for_exit(process, timeout=15)
+                if exited is None:
+                    # No pidfd support: communicate's own timeout handles it
+                    try:
+                        stdout, stderr = process.communicate(timeout=15)
+                        exited = True
+                    except subprocess.TimeoutExpired:
+                        exited = False
+
+                if exited:
+                    if stdout is None:
+                        stdout, stderr = process.communicate()
                     metadata["tts_triggered"] = True
                     metadata["tts_returncode"] = process.returncode
+                    # Raw bytes: the flush decodes only what it keeps
                     debug_log("TTS completed", {
                         "returncode": process.returncode,
-                        "stdout": stdout.decode(errors='replace') if stdout else "",
-                        "stderr": stderr.decode(errors='replace') if stderr else ""
+                        "stdout": stdout or b"",
+                        "stderr": stderr or b""
                     })
-                except subprocess.TimeoutExpired:
+                else:
                     # Kill entire process group to ensure mpg123 is terminated
                     try:
                         os.killpg(os.getpgid(process.pid), signal.SIGTERM)
@@ -305,27 +828,58 @@ def summarize_and_announce(transcript_path: str):
             "type": type(e).__name__
         })
 
+    finally:
+        # Don't block exit on pool threads; spawned children are detached
+        pool.shutdown(wait=False)
+
     debug_log("=== SUMMARIZE AND ANNOUNCE COMPLETE ===", metadata)
     return metadata
 
 
-def append_log_entry(log_path: Path, data: dict):
+# Hook log location; the O_APPEND fd is opened once and reused so each log
+# entry costs a single write() syscall instead of mkdir+open+write+close
+LOG_PATH = SCRIPT_DIR / "logs" / "response_summary.jsonl"
+_log_fd = None
+
+
+def append_log_entry(data: dict):
     """Append a JSON log entry to the log file."""
+    global _log_fd
     try:
-        with open(log_path, 'a') as f:
-            json.dump(data, f)
-            f.write('\n')
+        if _log_fd is None:
+            LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _log_fd = os.open(LOG_PATH, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        if orjson is not None:
+            # O_APPEND makes this a single atomic write on POSIX
+            os.write(_log_fd, orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            os.write(_log_fd, (json.dumps(data) + '\n').encode('utf-8'))
     except Exception:
         pass  # Fail silently on logging errors
 
 
+def _exit_fast():
+    """Exit without interpreter teardown (atexit, stdio unwind, final GC).
+
+    Safe here: log appends use unbuffered os.write, buffered debug records
+    are flushed below, and any TTS child is already detached.
+    """
+    _flush_debug()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
 def main():
     debug_log("### RESPONSE SUMMARY HOOK MAIN STARTED ###")
 
     try:
-        # Read JSON input from stdin
+        # Read JSON input from stdin (orjson parses the raw bytes directly)
         debug_log("Reading JSON input from stdin")
-        input_data = json.loads(sys.stdin.read())
+        if orjson is not None:
+            input_data = orjson.loads(sys.stdin.buffer.read())
+        else:
+            input_data = json.loads(sys.stdin.read())
         debug_log("Input data received", {
             "keys": list(input_data.keys()),
             "transcript_path": input_data.get('transcript_path'),
@@ -337,10 +891,10 @@ def main():
 
         if not transcript_path:
             debug_log("No transcript path provided, exiting")
-            sys.exit(0)  # No transcript path provided
+            _exit_fast()  # No transcript path provided
 
         # Check if response summary is enabled (opt-in via env var)
-        enabled = os.getenv('CLAUDE_RESPONSE_SUMMARY_ENABLED', 'false').lower() in ('true', '1', 'yes')
+        enabled = os.environ.get('CLAUDE_RESPONSE_SUMMARY_ENABLED', '').lower() in _TRUTHY
         debug_log("Feature enabled check", {
             "enabled": enabled,
             "env_var": os.getenv('CLAUDE_RESPONSE_SUMMARY_ENABLED', 'not set')
@@ -348,60 +902,64 @@ def main():
 
         if not enabled:
             debug_log("Feature disabled, exiting")
-            sys.exit(0)  # Feature disabled
+            _exit_fast()  # Feature disabled
 
         # Acquire exclusive lock to prevent concurrent executions across multiple Claude Code sessions
-        lock_file = Path("/tmp/claude_response_summary.lock")
+        # Raw fd: the file is only a lock, so skip the TextIOWrapper, and
+        # O_CLOEXEC keeps the fd from leaking into spawned TTS children
+        lock_file = "/tmp/claude_response_summary.lock"
         try:
-            lock_fd = open(lock_file, 'w')
+            lock_fd = os.open(lock_file, os.O_CREAT | os.O_RDWR | os.O_CLOEXEC, 0o600)
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             debug_log("Lock acquired")
         except (IOError, OSError):
-            debug_log("Another instance is running, exiting gracefully")
-            sys.exit(0)  # Another instance is already playing audio
+            # Queue our transcript so the lock holder batches it into one
+            # announcement instead of dropping it
+            enqueue_for_batch(transcript_path)
+            debug_log("Another instance is running, queued for batching")
+            _exit_fast()
 
         try:
             # Summarize and announce the response
             debug_log("Calling summarize_and_announce")
             metadata = summarize_and_announce(transcript_path)
+
+            # Merge any arrivals that queued up while we were speaking
+            batched = drain_summary_queue(transcript_path)
+            if batched:
+                metadata['batched_transcripts'] = batched
+                debug_log("Drained summary queue", {"batched": batched})
         finally:
             # Release lock
             try:
                 fcntl.flock(lock_fd, fcntl.LOCK_UN)
-                lock_fd.close()
+                os.close(lock_fd)
                 debug_log("Lock released")
             except:
                 pass
 
         # Debug logging
-        script_dir = Path(__file__).parent
-        log_dir = script_dir / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / "response_summary.jsonl"
-
+        from datetime import datetime
         input_data['timestamp'] = datetime.now().isoformat()
         input_data['metadata'] = metadata
-        append_log_entry(log_path, input_data)
+        append_log_entry(input_data)
 
         debug_log("### RESPONSE SUMMARY HOOK MAIN COMPLETE ###")
-        sys.exit(0)
+        _exit_fast()
 
     except json.JSONDecodeError as e:
         # Log JSON errors
         debug_log("ERROR: JSON decode failed", {"error": str(e)})
         try:
-            script_dir = Path(__file__).parent
-            log_dir = script_dir / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_path = log_dir / "response_summary.jsonl"
-            append_log_entry(log_path, {
+            from datetime import datetime
+            append_log_entry({
                 "error": "JSONDecodeError",
                 "details": str(e),
                 "timestamp": datetime.now().isoformat()
             })
         except:
             pass
-        sys.exit(0)
+        _exit_fast()
 
     except Exception as e:
         # Log all other errors
@@ -413,18 +971,15 @@ def main():
             "traceback": traceback.format_exc()
         })
         try:
-            script_dir = Path(__file__).parent
-            log_dir = script_dir / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_path = log_dir / "response_summary.jsonl"
-            append_log_entry(log_path, {
+            from datetime import datetime
+            append_log_entry({
                 "error": type(e).__name__,
                 "details": str(e),
                 "timestamp": datetime.now().isoformat()
             })
         except:
             pass
-        sys.exit(0)
+        _exit_fast()
 
 
 if __name__ == "__main__":
@@ -2,6 +2,7 @@
 # /// script
 # requires-python = ">=3.11"
 # dependencies = [
+#     "orjson",
 #     "python-dotenv",
 # ]
 # ///
@@ -11,78 +12,173 @@ import os
 import sys
 import random
 import subprocess
+import time
+import zlib
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv(Path.home() / '.env')
+    # Skip the .env parse when the hook runner already exported the keys we
+    # care about (the typical deployed case)
+    if not any(k in os.environ for k in (
+            'OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'ELEVENLABS_API_KEY',
+            'CLAUDE_SESSION_ID_ENABLED')):
+        from dotenv import load_dotenv
+        load_dotenv(Path.home() / '.env')
 except ImportError:
     pass  # dotenv is optional
 
-# Import shared message definitions
-sys.path.insert(0, str(Path(__file__).parent / "utils"))
-from messages import get_completion_messages
+try:
+    import orjson  # ~3-10x faster parse/serialize than stdlib json
+except ImportError:
+    orjson = None  # orjson is optional
+
+# Utils are imported lazily at their use sites so `python3 stop.py` startup
+# doesn't pay for modules the taken branch never touches
+UTILS_DIR = str(Path(__file__).parent / "utils")
+
+
+def _utils_path():
+    """Ensure the utils directory is importable (idempotent)."""
+    if UTILS_DIR not in sys.path:
+        sys.path.insert(0, UTILS_DIR)
 
 # LLM completion message generation timeout (seconds)
 LLM_TIMEOUT = 2
 
 
+@lru_cache(maxsize=1)
 def get_tts_script_path():
     """
     Get the cached TTS script path.
     Uses cached audio files when available to save API costs and reduce latency.
+
+    Memoized: the result is invariant for the process lifetime.
     """
-    # Get current script directory and construct utils/tts path
-    script_dir = Path(__file__).parent
-    tts_dir = script_dir / "utils" / "tts"
-
-    # Use cached TTS wrapper (supports all TTS backends with caching)
-    cached_tts_script = tts_dir / "cached_tts.py"
-    if cached_tts_script.exists():
-        return str(cached_tts_script)
-
-    # Fallback to non-cached scripts if cached_tts doesn't exist
-    # Check for OpenAI API key (highest priority - fastest and cheapest)
-    if os.getenv('OPENAI_API_KEY'):
-        openai_script = tts_dir / "openai_tts.py"
-        if openai_script.exists():
-            return str(openai_script)
-
-    # Check for ElevenLabs API key (second priority - higher quality but more expensive)
-    if os.getenv('ELEVENLABS_API_KEY'):
-        elevenlabs_script = tts_dir / "elevenlabs_tts.py"
-        if elevenlabs_script.exists():
-            return str(elevenlabs_script)
-
-    # Fall back to system voice (no API key required)
-    system_voice_script = tts_dir / "system_voice_tts.py"
-    if system_voice_script.exists():
-        return str(system_voice_script)
+    _utils_path()
+    from tts_resolve import resolve_tts_script
+    return resolve_tts_script(prefer_cached=True)
 
-    return None
+
+# Completion messages are likewise invariant per process; build the list once
+_MESSAGES = None
+
+
+def _messages():
+    global _MESSAGES
+    if _MESSAGES is None:
+        _utils_path()
+        from messages import get_completion_messages
+        _MESSAGES = get_completion_messages()
+    return _MESSAGES
+
+
+# LLM backends in priority order (OpenAI > Anthropic > Ollama)
+_LLM_DIR = Path(__file__).parent / "utils" / "llm"
+
+
+@lru_cache(maxsize=1)
+def _available_backends():
+    """Backends filtered by API key presence and script existence.
+
+    Memoized: computed on first LLM use, not at import, so the fast cached
+    message path never pays the stat calls.
+    """
+    return [
+        (backend_name, script_name[:-3], _LLM_DIR / script_name)
+        for api_key_env, script_name, backend_name in (
+            ("OPENAI_API_KEY", "oai.py", "openai"),
+            ("ANTHROPIC_API_KEY", "anth.py", "anthropic"),
+            (None, "ollama.py", "ollama"),  # Ollama doesn't need API key
+        )
+        if (api_key_env is None or os.getenv(api_key_env))
+        and (_LLM_DIR / script_name).exists()
+    ]
+
+# Imported backend modules, cached so the second probe is a dict lookup
+_llm_modules = {}
 
 
-def try_llm_backend(script_path):
+def _import_llm_backend(module_name):
+    """Import an LLM backend module once; None if its deps are missing."""
+    if module_name not in _llm_modules:
+        import importlib
+        try:
+            _llm_modules[module_name] = importlib.import_module(f"llm.{module_name}")
+        except Exception:
+            _llm_modules[module_name] = None
+    return _llm_modules[module_name]
+
+
+def try_llm_backend(script_path, module_name=None):
     """Try to generate completion message from a specific LLM backend.
 
+    Calls the backend in-process when its module imports (no fork, no uv
+    dependency resolution); spawns the script only as a fallback.
+
     Args:
         script_path: Path to the LLM backend script
+        module_name: Backend module under utils/llm (e.g. "oai")
 
     Returns:
         str or None: Generated message if successful, None otherwise
     """
+    mod = _import_llm_backend(module_name) if module_name else None
+    if mod is not None:
+        import signal
+
+        def _on_alarm(signum, frame):
+            raise TimeoutError("LLM backend timed out")
+
+        old_handler = signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, LLM_TIMEOUT)
+        try:
+            message = mod.generate_completion_message()
+            return message.strip() if message else None
+        except Exception:
+            return None
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+
+    # Fallback: the module's dependencies aren't importable here. Poll the
+    # pipe under one deadline instead of subprocess.run's wake-and-check
+    # timeout loop; a stalled backend is killed even mid-output.
+    import selectors
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["uv", "run", str(script_path), "--completion"],
-            capture_output=True,
-            text=True,
-            timeout=LLM_TIMEOUT
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
         )
-        if result.returncode == 0 and result.stdout.strip():
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-        pass
+    except OSError:
+        return None  # uv itself is unavailable
+
+    os.set_blocking(proc.stdout.fileno(), False)
+    sel = selectors.DefaultSelector()
+    sel.register(proc.stdout, selectors.EVENT_READ)
+
+    deadline = time.monotonic() + LLM_TIMEOUT
+    output_parts = []
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sel.select(remaining):
+                proc.kill()
+                proc.wait()
+                return None
+            chunk = proc.stdout.read()
+            if chunk:
+                output_parts.append(chunk)
+            elif chunk == b'':
+                break  # EOF
+    finally:
+        sel.close()
+
+    proc.wait()
+    output = b''.join(output_parts).decode('utf-8', errors='replace')
+    if proc.returncode == 0 and output.strip():
+        return output.strip()
     return None
 
 
@@ -94,41 +190,64 @@ def get_llm_completion_message_with_backend():
     Returns:
         tuple: (message: str, backend: str)
     """
-    script_dir = Path(__file__).parent
-    llm_dir = script_dir / "utils" / "llm"
-
-    # Try each backend in priority order
-    llm_backends = [
-        ("OPENAI_API_KEY", "oai.py", "openai"),
-        ("ANTHROPIC_API_KEY", "anth.py", "anthropic"),
-        (None, "ollama.py", "ollama"),  # Ollama doesn't need API key
-    ]
-
-    for api_key_env, script_name, backend_name in llm_backends:
-        # Skip if API key required but not present
-        if api_key_env and not os.getenv(api_key_env):
-            continue
-
-        script_path = llm_dir / script_name
-        if script_path.exists():
-            message = try_llm_backend(script_path)
-            if message:
-                return message, backend_name
+    # Try each available backend in priority order (resolved on first use)
+    for backend_name, module_name, script_path in _available_backends():
+        message = try_llm_backend(script_path, module_name=module_name)
+        if message:
+            return message, backend_name
 
     # Fallback to random cached message
-    messages = get_completion_messages()
+    messages = _messages()
     return random.choice(messages), "fallback"
 
-def get_llm_completion_message():
-    """Generate completion message (wrapper that discards backend info).
 
-    Returns:
-        str: Generated or fallback completion message
+# Persisted shuffled playback order: every completion message is heard once
+# before any repeats, and the hot path swaps the RNG call for an index bump
+_CYCLE_FILE = Path.home() / '.cache' / 'claude-speaks' / 'message_cycle.json'
+
+
+def _next_message():
+    """Next completion message from the persisted shuffled cycle.
+
+    Reshuffles when the cycle is exhausted, missing, or the message set
+    changed size.
     """
-    message, _ = get_llm_completion_message_with_backend()
+    messages = _messages()
+    try:
+        with open(_CYCLE_FILE) as f:
+            state = json.load(f)
+        order, pos = state['order'], state['pos']
+        if pos >= len(order) or len(order) != len(messages):
+            raise ValueError("cycle exhausted or stale")
+    except (OSError, ValueError, KeyError, TypeError):
+        order = random.sample(range(len(messages)), len(messages))
+        pos = 0
+
+    message = messages[order[pos]]
+
+    try:
+        _CYCLE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _CYCLE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps({'order': order, 'pos': pos + 1}))
+        os.replace(tmp_path, _CYCLE_FILE)
+    except OSError:
+        pass  # State write failure just means a fresh shuffle next time
+
     return message
 
 
+# NATO phonetic alphabet (single syllable preferred); a module-level tuple
+# so the table isn't rebuilt on every identifier lookup
+_PHONETICS = (
+    "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot",
+    "Golf", "Hotel", "India", "Juliet", "Kilo", "Lima",
+    "Mike", "November", "Oscar", "Papa", "Quebec", "Romeo",
+    "Sierra", "Tango", "Uniform", "Victor", "Whiskey", "X-ray",
+    "Yankee", "Zulu"
+)
+_N_PHONETICS = len(_PHONETICS)
+
+
 def get_session_identifier(session_id):
     """Generate a short phonetic identifier from session ID.
 
@@ -141,24 +260,12 @@ def get_session_identifier(session_id):
     if not session_id or session_id == "test":
         return None
 
-    # NATO phonetic alphabet (single syllable preferred)
-    phonetics = [
-        "Alpha", "Bravo", "Charlie", "Delta", "Echo", "Foxtrot",
-        "Golf", "Hotel", "India", "Juliet", "Kilo", "Lima",
-        "Mike", "November", "Oscar", "Papa", "Quebec", "Romeo",
-        "Sierra", "Tango", "Uniform", "Victor", "Whiskey", "X-ray",
-        "Yankee", "Zulu"
-    ]
-
-    # Use hash of session_id for consistent mapping
-    import hashlib
-    hash_val = int(hashlib.md5(session_id.encode()).hexdigest()[:8], 16)
+    # Use hash of session_id for consistent mapping. crc32 is stable across
+    # processes and orders of magnitude cheaper than MD5 for a 26-way bucket
+    hash_val = zlib.crc32(session_id.encode())
 
     # Get phonetic and number (0-9)
-    phonetic = phonetics[hash_val % len(phonetics)]
-    number = (hash_val // len(phonetics)) % 10
-
-    return f"{phonetic} {number}"
+    return f"{_PHONETICS[hash_val % _N_PHONETICS]} {(hash_val // _N_PHONETICS) % 10}"
 
 
 def select_completion_message_fast(session_id=None, include_session_id=False):
@@ -173,8 +280,7 @@ def select_completion_message_fast(session_id=None, include_session_id=False):
     Returns:
         tuple: (message: str, llm_generated: bool, backend: str)
     """
-    messages = get_completion_messages()
-    message = random.choice(messages)
+    message = _next_message()
 
     # Add session identifier if enabled and available
     if include_session_id and session_id:
@@ -219,36 +325,134 @@ def announce_completion(session_id=None, include_session_id=False):
         metadata["llm_backend"] = llm_backend
         metadata["tts_triggered"] = True
 
-        # Fire-and-forget: spawn TTS in background, don't wait for completion
-        subprocess.Popen(
-            [sys.executable, tts_script, message],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True  # Detach from parent process
-        )
+        # Warm path: hand the message to the persistent TTS daemon - a
+        # single sendto, no fork or interpreter startup
+        _utils_path()
+        from spawn import spawn_detached
+        from tts_client import send_to_tts_daemon, start_tts_daemon
+        from tts_resolve import tts_argv
+        if not send_to_tts_daemon(message):
+            # Fire-and-forget: detached posix_spawn of the script itself
+            # (no interpreter relaunch), same as notification.py
+            spawn_detached(tts_argv(tts_script, message))
+            # Warm the daemon for the next invocation
+            start_tts_daemon()
 
-    except (subprocess.SubprocessError, FileNotFoundError, Exception) as e:
+    except Exception as e:
         metadata["error"] = f"TTS spawn error: {type(e).__name__}"
 
     return metadata
 
 
+# 'append' writes the log directly; 'datagram' pushes each record to the
+# utils/logd.py daemon with one sendto (no open/close per entry)
+LOG_MODE = os.getenv('CLAUDE_LOG_MODE', 'append')
+
+
+def _send_log_datagram(data):
+    """Hand one serialized record to the log daemon; False if it isn't up."""
+    import socket
+    _utils_path()
+    from runtime import get_runtime_dir
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.sendto(b'stop\x00' + data, str(get_runtime_dir() / 'logd.sock'))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def flush_log(log_path):
+    """Force the log to stable storage with one fsync.
+
+    append_log_entry deliberately never fsyncs: per-entry fsync makes the
+    append path an order of magnitude slower for a best-effort debug log.
+    Anything that genuinely needs durability batches it behind this single
+    call instead.
+    """
+    try:
+        fd = os.open(str(log_path), os.O_WRONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Nothing to flush
+
+
 def append_log_entry(log_path, entry):
     """Append a single log entry to .jsonl file.
 
+    No fsync here by design - see flush_log for the durability escape
+    hatch.
+
     Args:
         log_path: Path to .jsonl log file
         entry: Dict to append as JSON line
     """
-    with open(log_path, 'a') as f:
-        json.dump(entry, f)
-        f.write('\n')
+    if orjson is not None:
+        data = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(entry, separators=(",", ":")) + "\n").encode('utf-8')
+
+    # Optional datagram mode: one sendto to the log daemon, zero file I/O
+    # here; fall through to the direct append when the daemon isn't up
+    if LOG_MODE == 'datagram' and _send_log_datagram(data):
+        return
+
+    # Build the record in memory and issue one os.write on an O_APPEND fd:
+    # atomic on POSIX, so concurrent hooks can't interleave records.
+    # Assume logs/ exists (the steady state) and create it only on failure,
+    # sparing the mkdir syscall on every invocation.
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        fd = os.open(str(log_path), flags, 0o644)
+    except FileNotFoundError:
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(log_path), flags, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=1)
+def _log_path():
+    """The stop hook's log file, resolved once per process."""
+    return Path(__file__).parent / "logs" / "stop.jsonl"
+
+
+def _log_error(exc):
+    """Record a main() failure; logging must never raise."""
+    try:
+        append_log_entry(_log_path(), {
+            "error": type(exc).__name__,
+            "details": str(exc),
+            "timestamp_ns": time.time_ns()
+        })
+    except:
+        pass
 
 
 def main():
     try:
-        # Read JSON input from stdin
-        input_data = json.load(sys.stdin)
+        # Read JSON input from the raw stdin fd: skips the TextIOWrapper /
+        # decoder setup sys.stdin pays. Payloads are small, but loop to EOF
+        # so an oversized one still parses.
+        chunks = []
+        while True:
+            chunk = os.read(0, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        raw = b''.join(chunks)
+
+        if orjson is not None:
+            input_data = orjson.loads(raw)
+        else:
+            input_data = json.loads(raw)
 
         # Extract session_id if available
         session_id = input_data.get('session_id')
@@ -259,39 +463,16 @@ def main():
         # Announce completion via TTS with optional session identifier
         metadata = announce_completion(session_id, include_session_id)
 
-        # Debug logging
-        script_dir = Path(__file__).parent
-        log_dir = script_dir / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
-        log_path = log_dir / "stop.jsonl"
-
-        input_data['timestamp'] = datetime.now().isoformat()
+        # Debug logging (append_log_entry creates logs/ on first use)
+        input_data['timestamp_ns'] = time.time_ns()
         input_data['metadata'] = metadata
-        append_log_entry(log_path, input_data)
+        append_log_entry(_log_path(), input_data)
 
         sys.exit(0)
 
-    except json.JSONDecodeError as e:
-        # Log JSON errors
-        try:
-            script_dir = Path(__file__).parent
-            log_dir = script_dir / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_path = log_dir / "stop.jsonl"
-            append_log_entry(log_path, {"error": "JSONDecodeError", "details": str(e), "timestamp": datetime.now().isoformat()})
-        except:
-            pass
-        sys.exit(0)
     except Exception as e:
-        # Log all other errors
-        try:
-            script_dir = Path(__file__).parent
-            log_dir = script_dir / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_path = log_dir / "stop.jsonl"
-            append_log_entry(log_path, {"error": type(e).__name__, "details": str(e), "timestamp": datetime.now().isoformat()})
-        except:
-            pass
+        # Log and exit cleanly on any error (JSON decode included)
+        _log_error(e)
         sys.exit(0)
 
 
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Pretty-print hook .jsonl logs.
+
+The hooks record raw time.time_ns() integers (timestamp_ns) to keep
+datetime construction and ISO formatting off their hot path; this reader
+does the formatting lazily when a human actually looks at the log.
+
+Usage: python3 utils/format_log.py logs/stop.jsonl
+"""
+
+import json
+import sys
+from datetime import datetime
+
+
+def format_entry(entry):
+    """Replace a timestamp_ns integer with a human-readable ISO timestamp."""
+    ts_ns = entry.pop('timestamp_ns', None)
+    if ts_ns is not None:
+        entry['timestamp'] = datetime.fromtimestamp(ts_ns / 1e9).isoformat()
+    return entry
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: format_log.py <log.jsonl>", file=sys.stderr)
+        return 1
+
+    with open(sys.argv[1]) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                print(line)  # Pass malformed lines through untouched
+                continue
+            print(json.dumps(format_entry(entry)))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+LLM backend package for Claude Code hooks.
+
+Modules: oai (OpenAI), anth (Anthropic), ollama (local Ollama), plus the
+summarizer and its daemon. Each backend exposes generate_completion_message()
+and can also run standalone via its uv shebang.
+"""
@@ -11,22 +11,17 @@
 
 import os
 import sys
-import random
 from pathlib import Path
 
 try:
-    from dotenv import load_dotenv
-    load_dotenv(Path.home() / '.env')
+    # Skip the .env parse when the provider keys are already exported
+    if not any(k in os.environ for k in (
+            'OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'OLLAMA_HOST')):
+        from dotenv import load_dotenv
+        load_dotenv(Path.home() / '.env')
 except ImportError:
     pass
 
-# Import completion messages for fallback
-sys.path.insert(0, str(Path(__file__).parent.parent))
-try:
-    from messages import get_completion_messages
-except ImportError:
-    get_completion_messages = None
-
 
 def summarize_with_ollama(text: str, timeout: int = 3) -> str:
     """Summarize text using local Ollama model (fastest, runs locally)."""
@@ -36,13 +31,9 @@ def summarize_with_ollama(text: str, timeout: int = 3) -> str:
         ollama_host = os.getenv("OLLAMA_HOST", "http://localhost:11434")
         ollama_model = os.getenv("OLLAMA_MODEL", "qwen2.5:3b")
 
-        # Check if Ollama is available
-        try:
-            requests.get(f"{ollama_host}/api/tags", timeout=1)
-        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
-            return None  # Ollama not running
-
-        # Generate summary using Ollama
+        # No separate liveness probe: when Ollama is down the POST fails
+        # fast with ConnectionError, and when it's up the probe was just an
+        # extra round-trip on the hot path
         response = requests.post(
             f"{ollama_host}/api/generate",
             json={
@@ -75,16 +66,36 @@ Summary (Claude Code speaking):""",
         return None
 
 
+# Lazy client singletons: in the long-lived summarizer daemon these keep the
+# TLS connection pool warm across calls instead of rebuilding an httpx
+# client (and paying DNS + handshake) per summary
+_openai_client = None
+_anthropic_client = None
+
+
+def _get_openai_client(timeout):
+    global _openai_client
+    if _openai_client is None:
+        from openai import OpenAI
+        _openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"), timeout=timeout)
+    return _openai_client
+
+
+def _get_anthropic_client(timeout):
+    global _anthropic_client
+    if _anthropic_client is None:
+        from anthropic import Anthropic
+        _anthropic_client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), timeout=timeout)
+    return _anthropic_client
+
+
 def summarize_with_openai(text: str, timeout: int = 8) -> str:
     """Summarize text using OpenAI (gpt-4o-mini)."""
     try:
-        from openai import OpenAI
-
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
+        if not os.getenv("OPENAI_API_KEY"):
             return None
 
-        client = OpenAI(api_key=api_key, timeout=timeout)
+        client = _get_openai_client(timeout)
 
         response = client.chat.completions.create(
             model="gpt-4o-mini",
@@ -113,13 +124,10 @@ Summary (Claude Code speaking):"""
 def summarize_with_anthropic(text: str, timeout: int = 2) -> str:
     """Summarize text using Anthropic (claude-haiku)."""
     try:
-        from anthropic import Anthropic
-
-        api_key = os.getenv("ANTHROPIC_API_KEY")
-        if not api_key:
+        if not os.getenv("ANTHROPIC_API_KEY"):
             return None
 
-        client = Anthropic(api_key=api_key, timeout=timeout)
+        client = _get_anthropic_client(timeout)
 
         response = client.messages.create(
             model="claude-3-5-haiku-20241022",
@@ -147,60 +155,74 @@ Summary (Claude Code speaking):"""
 
 
 def simple_summarize(text: str, max_words: int = 12) -> str:
-    """Simple fallback: take first N words and add ellipsis if truncated."""
-    words = text.split()
-    if len(words) <= max_words:
-        return text
+    """Simple fallback: take the first N words of the text.
 
-    # Take first max_words and add ellipsis
-    summary = ' '.join(words[:max_words])
+    The token scan stops after max_words+1 matches instead of splitting
+    the entire input, and the result is a slice of the original string
+    rather than a re-joined token list.
+    """
+    import itertools
+    import re
+
+    tokens = list(itertools.islice(re.finditer(r'\S+', text), max_words + 1))
+    if len(tokens) <= max_words:
+        return text
 
     # Try to end on a complete thought (look for sentence ending)
     for i in range(max_words - 1, max(0, max_words - 4), -1):
-        if words[i].rstrip().endswith(('.', '!', ':')):
-            summary = ' '.join(words[:i+1])
-            break
+        if tokens[i].group().endswith(('.', '!', ':')):
+            return text[:tokens[i].end()]
 
-    return summary
+    return text[:tokens[max_words - 1].end()]
 
 
 def summarize_response(text: str, timeout: int = 8) -> str:
     """
     Summarize Claude's response in one concise sentence, in Claude Code's voice.
 
-    Tries LLMs in order: Ollama (local) -> OpenAI -> Anthropic -> Completion messages
+    Races Ollama (local), OpenAI and Anthropic concurrently and returns the
+    first non-empty summary, so the latency is the fastest provider's
+    rather than the sum of serial timeouts.
 
     Args:
         text: The response text to summarize
-        timeout: Timeout in seconds for LLM calls
+        timeout: Timeout in seconds for the remote LLM calls
 
     Returns:
-        A concise summary sentence as if Claude Code is speaking
+        str or None: A concise summary sentence as if Claude Code is
+            speaking, or None when no provider produced one - callers
+            apply their own fallback so a canned phrase is never mistaken
+            for (or cached as) genuine LLM output
     """
     if not text or not text.strip():
-        return "Task complete"
+        return None
 
-    # Try Ollama first (fastest, local, ~200-500ms)
-    summary = summarize_with_ollama(text, timeout=3)
-    if summary:
-        return summary
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
-    # Try OpenAI as fallback (~2-3s)
-    summary = summarize_with_openai(text, timeout)
-    if summary:
-        return summary
+    executor = ThreadPoolExecutor(max_workers=3)
+    pending = {
+        executor.submit(summarize_with_ollama, text, 3),
+        executor.submit(summarize_with_openai, text, timeout),
+        executor.submit(summarize_with_anthropic, text, timeout),
+    }
 
-    # Try Anthropic as fallback
-    summary = summarize_with_anthropic(text, timeout)
-    if summary:
-        return summary
+    summary = None
+    try:
+        while pending and summary is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    result = future.result()
+                except Exception:
+                    result = None
+                if result:
+                    summary = result
+                    break
+    finally:
+        # Don't join the slower providers; their results are unwanted now
+        executor.shutdown(wait=False)
 
-    # Final fallback: use completion messages
-    if get_completion_messages:
-        messages = get_completion_messages()
-        return random.choice(messages)
-    else:
-        return "Task complete"
+    return summary
 
 
 def main():
@@ -208,7 +230,14 @@ def main():
     if len(sys.argv) > 1:
         text = " ".join(sys.argv[1:])
         summary = summarize_response(text)
-        print(summary)
+        if summary:
+            print(summary)
+        # Exit immediately (non-zero and silent when no provider answered,
+        # so callers apply their own fallback): the losing provider threads
+        # are non-daemon and would otherwise keep the process (and any
+        # waiting hook) alive until their timeouts expire
+        sys.stdout.flush()
+        os._exit(0 if summary else 1)
     else:
         # Test with sample text
         sample = """I'll add the cached sound files to .gitignore and commit the changes.
@@ -223,7 +252,7 @@ The commit includes:
 - Enhanced logging in `stop.py` with metadata and error tracking"""
 
         print("Sample text:", sample[:100] + "...")
-        print("\nSummary:", summarize_response(sample))
+        print("\nSummary:", summarize_response(sample) or "(no provider available)")
 
 
 if __name__ == "__main__":
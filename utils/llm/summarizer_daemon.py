@@ -0,0 +1,100 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.8"
+# dependencies = [
+#     "requests",
+#     "openai",
+#     "anthropic",
+#     "python-dotenv",
+# ]
+# ///
+"""
+Persistent summarizer daemon.
+
+Even an in-process summarizer call cold-starts the LLM clients and auth
+every hook invocation. This daemon keeps them initialized and serves
+summaries over an abstract unix socket: the hook sends the response text
+(newline-terminated) and reads the summary back, one RTT per call.
+
+The socket lives in the user's private runtime dir (0700) so other local
+users cannot query or stop the daemon; a flock guards against double
+starts. Send "__EXIT__" to stop the daemon.
+"""
+
+import fcntl
+import os
+import socket
+import sys
+from pathlib import Path
+
+# Import the sibling summarizer once (its LLM clients stay warm) and the
+# shared runtime-dir helper
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from runtime import ensure_runtime_dir, get_runtime_dir
+from summarizer import summarize_response
+
+
+def get_socket_path():
+    return get_runtime_dir() / 'summarizer.sock'
+
+
+def _recv_request(conn):
+    """Read one newline-terminated request from the connection."""
+    data = b''
+    while not data.endswith(b'\n'):
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        data += chunk
+    return data.decode('utf-8', errors='replace').strip()
+
+
+def main():
+    runtime_dir = ensure_runtime_dir()
+
+    # Single-instance guard: hold the lock for the daemon's lifetime
+    lock_fd = os.open(runtime_dir / 'summarizer_daemon.lock',
+                      os.O_CREAT | os.O_RDWR | os.O_CLOEXEC, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (IOError, OSError):
+        return 0  # Another daemon is already running
+
+    socket_path = get_socket_path()
+    try:
+        os.unlink(socket_path)
+    except OSError:
+        pass  # No stale socket to remove
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    sock.listen(4)
+
+    try:
+        while True:
+            conn, _ = sock.accept()
+            with conn:
+                text = _recv_request(conn)
+                if text == '__EXIT__':
+                    break
+                if not text:
+                    continue
+                try:
+                    summary = summarize_response(text)
+                except Exception:
+                    summary = ''  # Caller falls back to its simple summary
+                conn.sendall((summary or '').encode('utf-8'))
+    finally:
+        sock.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""
+Log append daemon.
+
+Hooks normally append their own log records (open+write+close per entry).
+With CLAUDE_LOG_MODE=datagram they instead push each serialized record to
+this daemon with a single sendto; the daemon holds one O_APPEND fd per log
+and absorbs the filesystem metadata traffic, which matters when logs/ sits
+on a slow or contended filesystem.
+
+Datagram format: b"<log-name>\\x00<json-line>". Send "__EXIT__" to stop.
+Only one daemon runs at a time (flock guard).
+"""
+
+import fcntl
+import os
+import socket
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+from runtime import ensure_runtime_dir, get_runtime_dir
+
+# Hook logs live next to the hook scripts, one level up from utils/
+LOG_DIR = Path(__file__).parent.parent / 'logs'
+
+# Accepted log names; anything else is dropped
+ALLOWED_LOGS = frozenset({'stop', 'notification', 'response_summary'})
+
+
+def get_socket_path():
+    return get_runtime_dir() / 'logd.sock'
+
+
+def main():
+    runtime_dir = ensure_runtime_dir()
+
+    # Single-instance guard: hold the lock for the daemon's lifetime
+    lock_fd = os.open(runtime_dir / 'logd.lock',
+                      os.O_CREAT | os.O_RDWR | os.O_CLOEXEC, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (IOError, OSError):
+        return 0  # Another daemon is already running
+
+    socket_path = get_socket_path()
+    try:
+        os.unlink(socket_path)
+    except OSError:
+        pass  # No stale socket to remove
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    log_fds = {}
+
+    try:
+        while True:
+            data, _ = sock.recvfrom(65536)
+            if data == b'__EXIT__':
+                break
+            name, sep, payload = data.partition(b'\x00')
+            if not sep or not payload:
+                continue
+            log_name = name.decode('utf-8', errors='replace')
+            if log_name not in ALLOWED_LOGS:
+                continue
+            fd = log_fds.get(log_name)
+            if fd is None:
+                fd = os.open(LOG_DIR / f'{log_name}.jsonl',
+                             os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                log_fds[log_name] = fd
+            if not payload.endswith(b'\n'):
+                payload += b'\n'
+            os.write(fd, payload)
+    finally:
+        sock.close()
+        for fd in log_fds.values():
+            os.close(fd)
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -29,14 +29,9 @@ def get_notification_messages(include_personalized=True):
     return messages
 
 
-def get_completion_messages():
-    """
-    Get completion messages used when agent finishes a task.
-
-    Returns:
-        list: Completion message strings
-    """
-    return [
+# Hoisted to module scope as a tuple: the list literal used to be rebuilt
+# (60 references plus a list header) on every call
+_COMPLETION_MESSAGES = (
         "Work complete!",
         "All done!",
         "Task finished!",
@@ -95,7 +90,17 @@ def get_completion_messages():
         "Hasta la vista, baby!",
         # Taulia
         "We get shit done!"
-    ]
+)
+
+
+def get_completion_messages():
+    """
+    Get completion messages used when agent finishes a task.
+
+    Returns:
+        tuple: Completion message strings
+    """
+    return _COMPLETION_MESSAGES
 
 
 def get_all_messages():
@@ -0,0 +1,25 @@
+"""
+Shared per-user runtime directory for claude-speaks IPC.
+
+The daemon sockets, lock files and queues all live under one private
+directory (XDG runtime dir preferred, ~/.cache otherwise). Deriving the
+path here keeps the client and daemon sides of each socket pair in sync.
+"""
+
+import os
+from pathlib import Path
+
+
+def get_runtime_dir():
+    """The claude-speaks runtime directory (not created)."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    base = Path(runtime_dir) if runtime_dir else Path.home() / '.cache'
+    return base / 'claude-speaks'
+
+
+def ensure_runtime_dir():
+    """Create the runtime directory restricted to this user and return it."""
+    runtime_dir = get_runtime_dir()
+    runtime_dir.mkdir(parents=True, exist_ok=True)
+    os.chmod(runtime_dir, 0o700)  # Keep sockets and queues private
+    return runtime_dir
@@ -4,14 +4,97 @@ Utility for reading and extracting Claude responses from conversation transcript
 """
 
 import json
+import mmap
+import os
+import time
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    import orjson  # ~3-10x faster parse than stdlib json
+except ImportError:
+    orjson = None  # orjson is optional
+
+# On-disk cache for extracted responses, keyed by (path, size, mtime_ns).
+# Hooks re-trigger on the same transcript within a session; a hit skips
+# re-parsing the whole JSONL file. The in-process memo backs repeat calls
+# within one hook invocation.
+_CACHE_FILE = Path('/tmp/claude_transcript_cache.json')
+_CACHE_MAX_ENTRIES = 8
+
+# Only persist results when parsing was actually slow (memoize only slow
+# computations); tiny transcripts are cheaper to re-read than to cache.
+_CACHE_THRESHOLD_NS = 512_000
+
+_memo = {}
+
+
+def _transcript_cache_key(transcript_path: str) -> Optional[str]:
+    """Build the cache key from the transcript's path, size and mtime."""
+    try:
+        st = os.stat(transcript_path)
+    except OSError:
+        return None
+    return f"{transcript_path}:{st.st_size}:{st.st_mtime_ns}"
+
+
+def _read_disk_cache() -> dict:
+    try:
+        with open(_CACHE_FILE) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _write_disk_cache(cache: dict):
+    # Keep the cache bounded; drop oldest insertions first
+    while len(cache) > _CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    try:
+        tmp_file = _CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        # 0600: the cache carries conversation content and /tmp is shared
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, _CACHE_FILE)
+    except OSError:
+        pass  # Cache write failure is non-critical
+
+
+def _extract_assistant_text(line):
+    """Pull the first text block out of an assistant JSONL line, or None."""
+    try:
+        if orjson is not None:
+            entry = orjson.loads(line)
+        else:
+            entry = json.loads(line)
+    except json.JSONDecodeError:
+        return None  # Skip malformed lines
+
+    # Look for assistant messages with text content
+    if entry.get('type') == 'assistant' and 'message' in entry:
+        message = entry['message']
+        if message.get('role') == 'assistant' and 'content' in message:
+            # Extract text blocks from content
+            for content_block in message['content']:
+                if isinstance(content_block, dict) and content_block.get('type') == 'text':
+                    text = content_block.get('text', '').strip()
+                    if text:
+                        return text  # Only take first text block per message
+    return None
+
 
 def get_latest_assistant_responses(transcript_path: str, limit: int = 5) -> List[str]:
     """
     Extract the latest assistant text responses from a conversation transcript.
 
+    Walks the file backwards via mmap, locating newlines with rfind (libc
+    memchr under the hood) and stopping as soon as `limit` responses are
+    found - only the tail pages of a multi-MB transcript get faulted in.
+
     Args:
         transcript_path: Path to the JSONL transcript file
         limit: Maximum number of recent responses to return
@@ -19,39 +102,27 @@ def get_latest_assistant_responses(transcript_path: str, limit: int = 5) -> List
     Returns:
         List of text responses from assistant (newest first)
     """
-    transcript_file = Path(transcript_path)
-    if not transcript_file.exists():
-        return []
-
     responses = []
 
     try:
-        # Read transcript in reverse to get latest messages first
-        with open(transcript_file, 'r') as f:
-            lines = f.readlines()
-
-        # Process lines in reverse order
-        for line in reversed(lines):
-            if len(responses) >= limit:
-                break
+        with open(transcript_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                return []  # Empty file
 
             try:
-                entry = json.loads(line.strip())
-
-                # Look for assistant messages with text content
-                if entry.get('type') == 'assistant' and 'message' in entry:
-                    message = entry['message']
-                    if message.get('role') == 'assistant' and 'content' in message:
-                        # Extract text blocks from content
-                        for content_block in message['content']:
-                            if isinstance(content_block, dict) and content_block.get('type') == 'text':
-                                text = content_block.get('text', '').strip()
-                                if text:
-                                    responses.append(text)
-                                    break  # Only take first text block per message
-
-            except json.JSONDecodeError:
-                continue  # Skip malformed lines
+                end = len(mm)
+                while end > 0 and len(responses) < limit:
+                    newline = mm.rfind(b'\n', 0, end)
+                    line = mm[newline + 1:end]
+                    if line.strip():
+                        text = _extract_assistant_text(line)
+                        if text:
+                            responses.append(text)
+                    end = newline  # -1 (no more newlines) terminates the loop
+            finally:
+                mm.close()
 
     except Exception:
         return []
@@ -70,13 +141,37 @@ def get_combined_response(transcript_path: str, max_chars: Optional[int] = None)
     Returns:
         Latest response text or None if no responses found
     """
-    responses = get_latest_assistant_responses(transcript_path, limit=1)
-
-    if not responses:
-        return None
-
-    # Combine responses (newest first, so reverse to get chronological order)
-    combined = '\n\n'.join(reversed(responses))
+    key = _transcript_cache_key(transcript_path)
+
+    combined = None
+    disk_cache = None
+    if key is not None:
+        if key in _memo:
+            combined = _memo[key]
+        else:
+            disk_cache = _read_disk_cache()
+            if key in disk_cache:
+                combined = disk_cache[key]
+                _memo[key] = combined
+
+    if combined is None:
+        start_ns = time.perf_counter_ns()
+        responses = get_latest_assistant_responses(transcript_path, limit=1)
+        elapsed_ns = time.perf_counter_ns() - start_ns
+
+        if not responses:
+            return None
+
+        # Combine responses (newest first, so reverse to get chronological order)
+        combined = '\n\n'.join(reversed(responses))
+
+        # Memoize only when parsing was slow enough to be worth caching
+        if key is not None and elapsed_ns > _CACHE_THRESHOLD_NS:
+            _memo[key] = combined
+            if disk_cache is None:
+                disk_cache = _read_disk_cache()
+            disk_cache[key] = combined
+            _write_disk_cache(disk_cache)
 
     # Truncate if max_chars specified
     if max_chars and len(combined) > max_chars:
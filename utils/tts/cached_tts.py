@@ -42,21 +42,53 @@ def get_cache_dir():
 
 
 def get_cache_key(text):
-    """Generate cache key from text using MD5 hash."""
-    return hashlib.md5(text.encode('utf-8')).hexdigest()
+    """Generate cache key from text using BLAKE2b.
+
+    Faster than MD5 (and not cryptographically tainted) while staying in
+    the stdlib; 16 bytes keeps filenames the same length as before.
+    """
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
 
 def get_cached_audio_path(text):
-    """Get path to cached audio file for given text and current voice."""
+    """Get path to cached audio file for given text and current voice.
+
+    Transparently migrates entries cached under the old MD5 naming the
+    first time they're looked up.
+    """
     cache_dir = get_cache_dir()
     cache_key = get_cache_key(text)
-    return cache_dir / f"{cache_key}.mp3"
+    audio_path = cache_dir / f"{cache_key}.mp3"
+
+    if not audio_path.exists():
+        legacy_path = cache_dir / f"{hashlib.md5(text.encode('utf-8')).hexdigest()}.mp3"
+        if legacy_path.exists():
+            try:
+                os.replace(legacy_path, audio_path)
+            except OSError:
+                pass  # Keep using the legacy file via regeneration
+
+    return audio_path
+
+
+def get_player_env():
+    """Minimal environment for audio players.
+
+    Only the variables PipeWire/PulseAudio playback actually needs; avoids
+    duplicating the full process environment into every spawned player.
+    """
+    return {
+        'PATH': os.environ.get('PATH', ''),
+        'HOME': os.environ.get('HOME', ''),
+        'XDG_RUNTIME_DIR': os.environ.get('XDG_RUNTIME_DIR', ''),
+        'DBUS_SESSION_BUS_ADDRESS': os.environ.get('DBUS_SESSION_BUS_ADDRESS', ''),
+    }
 
 
 def play_audio(audio_file):
     """Play audio file using available system player (non-blocking)."""
     # Preserve audio environment variables for PipeWire/PulseAudio
-    env = os.environ.copy()
+    env = get_player_env()
 
     try:
         # macOS - spawn in background to avoid blocking
@@ -211,6 +243,20 @@ def speak_with_cache(text, verbose=False):
         tts_script = get_tts_script_path()
         if tts_script:
             result["tts_backend"] = Path(tts_script).stem
+            # Call the backend module in-process first: inside the TTS
+            # daemon this keeps its API client and player warm across
+            # utterances, and in one-shot use it skips a second interpreter
+            try:
+                import importlib
+                script_dir = str(Path(tts_script).parent)
+                if script_dir not in sys.path:
+                    sys.path.insert(0, script_dir)
+                backend = importlib.import_module(Path(tts_script).stem)
+                if backend.speak(text):
+                    return result
+            except Exception:
+                pass  # Missing deps in this interpreter; spawn instead
+
             try:
                 # Run TTS script synchronously to ensure completion
                 subprocess.run(
@@ -7,99 +7,536 @@
 # ]
 # ///
 
+import hashlib
 import os
 import sys
 import subprocess
-import tempfile
+from collections import OrderedDict
 from pathlib import Path
 
-try:
-    from dotenv import load_dotenv
-    load_dotenv(Path.home() / '.env')
-except ImportError:
-    pass
+# Skip the dotenv import and .env parse entirely when the key is already
+# exported (CI, shell profiles) - the common fast case
+if not os.environ.get('OPENAI_API_KEY'):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv(Path.home() / '.env')
+    except ImportError:
+        pass
+
+# Voice configuration (part of the cache key so changes don't collide).
+# WAV output: replays skip the MP3 decode entirely and go straight to a
+# lightweight PCM player
+TTS_MODEL = "tts-1"
+TTS_VOICE = "ash"
+TTS_FORMAT = "wav"
+
+# Content-addressed audio cache: repeated phrases skip the API round-trip
+# (typically 300-1500ms) and its cost entirely
+CACHE_DIR = Path(os.getenv("OPENAI_TTS_CACHE", str(Path.home() / ".cache" / "openai_tts")))
+CACHE_MAX_BYTES = int(os.getenv("OPENAI_TTS_CACHE_MAX", str(50 * 1024 * 1024)))
+
+# Debug flag read once at import, not per call
+_DEBUG = os.getenv('OPENAI_TTS_DEBUG', 'false').lower() in ('true', '1')
 
-def speak(text):
-    """Use OpenAI TTS to generate and play speech"""
-    api_key = os.getenv('OPENAI_API_KEY')
-    if not api_key:
-        return False
 
+def get_cached_audio_path(text):
+    """Cache path for (model, voice, text)."""
+    key = hashlib.sha256(f"{TTS_MODEL}|{TTS_VOICE}|{text}".encode('utf-8')).hexdigest()
+    return CACHE_DIR / f"{key}.{TTS_FORMAT}"
+
+
+def _make_cache_dir():
+    """Create the cache dir restricted to this user (it holds spoken
+    conversation content)."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    os.chmod(CACHE_DIR, 0o700)
+
+
+def evict_cache():
+    """Drop least-recently-used entries until the cache fits its budget.
+
+    Also sweeps .tmp orphans left by generations that died mid-stream.
+    """
+    import time
     try:
-        from openai import OpenAI
+        entries = []
+        total_size = 0
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp'):
+                    try:
+                        # Stale after an hour: no live writer takes that long
+                        if time.time() - entry.stat().st_mtime > 3600:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+                    continue
+                if entry.name.endswith(('.mp3', '.wav')):
+                    st = entry.stat()
+                    entries.append((st.st_atime, st.st_size, entry.path))
+                    total_size += st.st_size
 
-        client = OpenAI(api_key=api_key)
+        if total_size <= CACHE_MAX_BYTES:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.unlink(path)
+                total_size -= size
+            except OSError:
+                continue
+            if total_size <= CACHE_MAX_BYTES:
+                break
+    except OSError:
+        pass  # Eviction is best-effort
 
-        # Generate audio using TTS-1 (standard quality, fast)
-        response = client.audio.speech.create(
-            model="tts-1",
-            voice="ash",
-            input=text
-        )
 
-        # Save to temp file
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as f:
-            f.write(response.content)
-            audio_file = f.name
+class _Player:
+    """Long-lived mpg123 remote-control player shared across speak() calls.
 
-        # Play using system command
-        # Preserve audio environment variables for PulseAudio/PipeWire
-        env = os.environ.copy()
+    One fork at first use instead of a player fork+exec per utterance;
+    later plays cost a pipe write plus a status read.
+    """
 
-        # Debug logging
-        import sys
-        debug = os.getenv('OPENAI_TTS_DEBUG', 'false').lower() in ('true', '1')
+    _proc = None
 
+    @classmethod
+    def _get(cls):
+        if cls._proc is None or cls._proc.poll() is not None:
+            cls._proc = subprocess.Popen(
+                ['mpg123', '-R'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=0,
+                close_fds=False
+            )
+            import atexit
+            atexit.register(cls.close)
+        return cls._proc
+
+    @classmethod
+    def play(cls, audio_file):
+        """Play through the persistent player; False to use the spawn chain."""
         try:
-            # macOS
-            if debug:
-                print("Trying afplay...", file=sys.stderr)
-            subprocess.run(['afplay', audio_file], check=True, timeout=10, env=env)
-            if debug:
-                print("afplay succeeded", file=sys.stderr)
-        except FileNotFoundError:
+            proc = cls._get()
+        except OSError:
+            return False  # No mpg123 on PATH
+
+        try:
+            proc.stdin.write(f"LOAD {audio_file}\n".encode())
+            proc.stdin.flush()
+            # mpg123 generic control protocol: @P 0 marks playback stopped,
+            # @E an error (e.g. unreadable file)
+            while True:
+                line = proc.stdout.readline()
+                if not line:
+                    return False  # Player died mid-play
+                if line.startswith(b'@E'):
+                    return False
+                if line.startswith(b'@P 0'):
+                    return True
+        except OSError:
+            return False
+
+    @classmethod
+    def close(cls):
+        if cls._proc is not None and cls._proc.poll() is None:
             try:
-                # Linux with mpg123 (best for MP3)
-                if debug:
-                    print("Trying mpg123...", file=sys.stderr)
-                subprocess.run(['mpg123', '-q', audio_file], check=True, timeout=10, env=env)
-                if debug:
-                    print("mpg123 succeeded", file=sys.stderr)
+                cls._proc.stdin.write(b'QUIT\n')
+                cls._proc.stdin.flush()
+            except OSError:
+                pass
+            cls._proc.kill()
+
+
+# WAV-capable players in preference order; detection runs once and the
+# winner is persisted so later processes skip even the PATH scans
+_PLAYERS = {
+    'afplay': ['afplay'],
+    'aplay': ['aplay', '-q'],
+    # Explicit -f wav skips ffmpeg's format probe; the low-delay flags cut
+    # its startup buffering window
+    'ffplay': ['ffplay', '-hide_banner', '-loglevel', 'quiet', '-nostats',
+               '-nodisp', '-autoexit', '-fflags', 'nobuffer', '-flags',
+               'low_delay', '-probesize', '32', '-analyzeduration', '0',
+               '-f', 'wav'],
+}
+_PLAYER_PREFERENCE = ('afplay', 'aplay', 'ffplay')
+_PLAYER_STATE_FILE = CACHE_DIR / 'player'
+_player_argv = None
+
+
+def _detect_player():
+    """Resolve the playback argv once per process (persisted across runs)."""
+    global _player_argv
+    if _player_argv is not None:
+        return _player_argv
+
+    import shutil
+
+    name = None
+    try:
+        cached = _PLAYER_STATE_FILE.read_text().strip()
+        if cached in _PLAYERS and shutil.which(cached):
+            name = cached
+    except OSError:
+        pass
+
+    if name is None:
+        for candidate in _PLAYER_PREFERENCE:
+            if shutil.which(candidate):
+                name = candidate
+                break
+        if name:
+            try:
+                _make_cache_dir()
+                _PLAYER_STATE_FILE.write_text(name)
+            except OSError:
+                pass  # Re-detect next run
+
+    _player_argv = _PLAYERS[name] if name else []
+    return _player_argv
+
+
+def play_file(audio_file):
+    """Play an audio file.
+
+    WAV goes through the probed decode-free player (no per-call fallback
+    cascade of failed spawns); MP3 through the persistent mpg123 worker
+    with the spawn chain as fallback.
+    """
+    if audio_file.endswith('.wav'):
+        argv = _detect_player()
+        if not argv:
+            return  # No player available
+        try:
+            subprocess.run(argv + [audio_file], check=True, timeout=10,
+                           stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL,
+                           close_fds=False)
+        except (FileNotFoundError, subprocess.SubprocessError):
+            pass  # Runtime playback failure; nothing further to try
+        return
+
+    if _Player.play(audio_file):
+        return
+    try:
+        # macOS
+        if _DEBUG:
+            print("Trying afplay...", file=sys.stderr)
+        subprocess.run(['afplay', audio_file], check=True, timeout=10, close_fds=False)
+        if _DEBUG:
+            print("afplay succeeded", file=sys.stderr)
+    except FileNotFoundError:
+        try:
+            # Linux with mpg123 (best for MP3)
+            if _DEBUG:
+                print("Trying mpg123...", file=sys.stderr)
+            subprocess.run(['mpg123', '-q', audio_file], check=True, timeout=10, close_fds=False)
+            if _DEBUG:
+                print("mpg123 succeeded", file=sys.stderr)
+        except (FileNotFoundError, subprocess.SubprocessError) as e:
+            if _DEBUG:
+                print(f"mpg123 failed: {e}", file=sys.stderr)
+            try:
+                # Linux with ffplay (fallback)
+                if _DEBUG:
+                    print("Trying ffplay...", file=sys.stderr)
+                subprocess.run(['ffplay', '-hide_banner', '-loglevel', 'quiet',
+                              '-nostats', '-nodisp', '-autoexit',
+                              '-probesize', '32', '-analyzeduration', '0',
+                              '-f', 'mp3', audio_file],
+                             check=True, timeout=10,
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL,
+                             close_fds=False)
+                if _DEBUG:
+                    print("ffplay succeeded", file=sys.stderr)
             except (FileNotFoundError, subprocess.SubprocessError) as e:
-                if debug:
-                    print(f"mpg123 failed: {e}", file=sys.stderr)
-                try:
-                    # Linux with ffplay (fallback)
-                    if debug:
-                        print("Trying ffplay...", file=sys.stderr)
-                    subprocess.run(['ffplay', '-nodisp', '-autoexit', '-loglevel', 'quiet', audio_file],
-                                 check=True, timeout=10,
-                                 stdout=subprocess.DEVNULL,
-                                 stderr=subprocess.DEVNULL,
-                                 env=env)
-                    if debug:
-                        print("ffplay succeeded", file=sys.stderr)
-                except (FileNotFoundError, subprocess.SubprocessError) as e:
-                    if debug:
-                        print(f"ffplay failed: {e}", file=sys.stderr)
-        except subprocess.SubprocessError as e:
-            if debug:
-                print(f"afplay failed: {e}", file=sys.stderr)
-
-        # Clean up temp file
+                if _DEBUG:
+                    print(f"ffplay failed: {e}", file=sys.stderr)
+    except subprocess.SubprocessError as e:
+        if _DEBUG:
+            print(f"afplay failed: {e}", file=sys.stderr)
+
+
+# In-memory LRU of the hottest phrases' audio bytes. In the long-lived TTS
+# daemon (which imports this module) replays skip even the disk read: the
+# bytes are staged once to tmpfs and the player reuses that path.
+_MEM_CACHE = OrderedDict()
+_MEM_CACHE_MAX = 32
+_SHM_DIR = Path('/dev/shm')
+
+
+def _shm_staging_dir():
+    """Per-user 0700 staging dir under /dev/shm.
+
+    /dev/shm itself is world-writable, so bare files there could be
+    pre-created by another user and played back as planted audio. A private
+    subdirectory owned by us (verified, not just created) closes that off.
+
+    Returns:
+        Path or None: The staging dir, or None when tmpfs is unavailable or
+            the name is squatted by another user
+    """
+    if not _SHM_DIR.is_dir():
+        return None
+    staging = _SHM_DIR / f'openai_tts-{os.getuid()}'
+    try:
+        staging.mkdir(mode=0o700, exist_ok=True)
+        st = staging.stat()
+        if st.st_uid != os.getuid() or (st.st_mode & 0o777) != 0o700:
+            return None  # Someone else owns or opened up this name
+    except OSError:
+        return None
+    return staging
+
+
+def _remember_audio(audio_file):
+    """Add a cache file's bytes to the bounded in-memory LRU."""
+    try:
+        data = audio_file.read_bytes()
+    except OSError:
+        return
+    _MEM_CACHE[audio_file.name] = data
+    _MEM_CACHE.move_to_end(audio_file.name)
+    while len(_MEM_CACHE) > _MEM_CACHE_MAX:
+        _MEM_CACHE.popitem(last=False)
+
+
+def _play_from_memory(audio_file):
+    """Play a hot phrase from the in-memory cache via tmpfs.
+
+    Returns:
+        bool: False on LRU miss or when tmpfs staging is unavailable
+    """
+    data = _MEM_CACHE.get(audio_file.name)
+    if data is None:
+        return False
+    staging_dir = _shm_staging_dir()
+    if staging_dir is None:
+        return False
+    _MEM_CACHE.move_to_end(audio_file.name)
+
+    # Inside our verified 0700 dir the name can't be squatted; an existing
+    # file is necessarily one we staged earlier
+    shm_path = staging_dir / audio_file.name
+    try:
+        if not shm_path.exists():
+            # 0600: the audio may carry spoken conversation content
+            fd = os.open(shm_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+    except OSError:
+        return False
+
+    play_file(str(shm_path))
+    return True
+
+
+# Lazy client singleton: repeated speak() calls in one process reuse the
+# warm HTTPS connection pool instead of paying TLS setup each time
+_client = None
+
+
+def _get_client(api_key):
+    global _client
+    if _client is None:
+        import httpx
+        from openai import OpenAI
+        # Bound the round-trip: 5s total / 2s connect with one fast retry.
+        # The SDK default timeout is minutes, which would hang the hook
+        # whenever the API is degraded; on failure speak() returns False
+        # and the caller falls back to the next TTS backend.
+        _client = OpenAI(
+            api_key=api_key,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            max_retries=1
+        )
+    return _client
+
+
+def speak(text):
+    """Use OpenAI TTS to generate and play speech (cached by content)."""
+    audio_file = get_cached_audio_path(text)
+
+    # Cache hit: skip the API entirely (hottest phrases skip the disk too)
+    try:
+        if audio_file.stat().st_size > 0:
+            if not _play_from_memory(audio_file):
+                play_file(str(audio_file))
+                _remember_audio(audio_file)
+            return True
+    except OSError:
+        pass  # Miss; generate below
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        return False
+
+    try:
+        client = _get_client(api_key)
+
+        _make_cache_dir()
+        tmp_file = audio_file.with_suffix(f'.{os.getpid()}.tmp')
+
+        # Pipe-fed player so audio starts before the download finishes
+        # (aplay reads the WAV header straight off stdin)
         try:
-            os.unlink(audio_file)
+            player = subprocess.Popen(
+                ['aplay', '-q'],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False
+            )
         except OSError:
-            pass
+            player = None  # No aplay; play from the cache file afterwards
+
+        # Stream the response, teeing each chunk to the player and to the
+        # cache (atomic rename below, so a torn write reads as a miss)
+        with client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format=TTS_FORMAT
+        ) as response:
+            with open(tmp_file, 'wb') as cache_out:
+                for chunk in response.iter_bytes(8192):
+                    cache_out.write(chunk)
+                    if player is not None:
+                        try:
+                            player.stdin.write(chunk)
+                        except OSError:
+                            player = None  # Player died; keep caching
+
+        os.replace(tmp_file, audio_file)
+
+        if player is not None:
+            try:
+                player.stdin.close()
+                player.wait(timeout=15)
+            except (OSError, subprocess.TimeoutExpired):
+                player.kill()
+        else:
+            play_file(str(audio_file))
+
+        # Keep the cache within budget (best-effort)
+        evict_cache()
 
         return True
 
     except Exception:
         return False
 
+
+def generate_to_cache(text):
+    """Generate audio into the cache without playing it.
+
+    Returns:
+        bool: True if the phrase is cached (already or freshly generated)
+    """
+    audio_file = get_cached_audio_path(text)
+    try:
+        if audio_file.stat().st_size > 0:
+            return True  # Already cached
+    except OSError:
+        pass
+
+    api_key = os.getenv('OPENAI_API_KEY')
+    if not api_key:
+        return False
+
+    try:
+        client = _get_client(api_key)
+        _make_cache_dir()
+        tmp_file = audio_file.with_suffix(f'.{os.getpid()}.tmp')
+        with client.audio.speech.with_streaming_response.create(
+            model=TTS_MODEL,
+            voice=TTS_VOICE,
+            input=text,
+            response_format=TTS_FORMAT
+        ) as response:
+            with open(tmp_file, 'wb') as cache_out:
+                for chunk in response.iter_bytes(8192):
+                    cache_out.write(chunk)
+        os.replace(tmp_file, audio_file)
+        return True
+    except Exception:
+        return False
+
+
+def precache(texts):
+    """Populate the cache for a list of phrases concurrently.
+
+    Returns:
+        int: Number of phrases now cached
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        return sum(pool.map(generate_to_cache, texts))
+
+
+def batch_main():
+    """Read newline-delimited phrases from stdin and speak them in bursts.
+
+    Lines that arrive within a 50ms debounce window are concatenated into
+    one API call (and one cache entry), so a burst of N status phrases
+    costs a single round-trip instead of N.
+    """
+    import select
+
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            return 0  # EOF
+
+        phrases = [line.strip()]
+        # Debounce: absorb lines that arrive within 50ms of each other
+        while select.select([sys.stdin], [], [], 0.05)[0]:
+            line = sys.stdin.readline()
+            if not line:
+                break
+            phrases.append(line.strip())
+
+        text = ' '.join(p for p in phrases if p)
+        if text:
+            speak(text)
+        if not line:
+            return 0  # EOF mid-burst
+
+
 if __name__ == '__main__':
     if len(sys.argv) > 1:
+        if sys.argv[1] in ('-', '--batch'):
+            sys.exit(batch_main())
+        if sys.argv[1] == '--precache' and len(sys.argv) > 2:
+            # Warm the cache for a file of phrases (one per line) so later
+            # real invocations are pure local playback
+            with open(sys.argv[2]) as f:
+                phrases = [line.strip() for line in f if line.strip()]
+            cached = precache(phrases)
+            print(f"Cached {cached}/{len(phrases)} phrases")
+            sys.exit(0 if cached == len(phrases) else 1)
+        if sys.argv[1] == '--cache-only' and len(sys.argv) > 2:
+            sys.exit(0 if generate_to_cache(' '.join(sys.argv[2:])) else 1)
         message = ' '.join(sys.argv[1:])
+
+        # One-shot CLI with a cache hit: replace this interpreter with the
+        # player via execvp - one fewer process, and no Python RSS held
+        # for the duration of playback. Misses keep speak()'s streaming
+        # path so audio still overlaps the download.
+        try:
+            audio_file = get_cached_audio_path(message)
+            if audio_file.stat().st_size > 0:
+                argv = _detect_player()
+                if argv:
+                    os.execvp(argv[0], argv + [str(audio_file)])
+        except OSError:
+            pass  # Fall through to the normal path
+
         if speak(message):
             sys.exit(0)
         else:
@@ -0,0 +1,211 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#     "python-dotenv",
+#     "requests",
+# ]
+# ///
+"""
+Persistent TTS daemon.
+
+Spawning a fresh TTS process per hook pays ~50-100ms of interpreter
+startup and imports before any audio plays. This daemon loads everything
+once and then loops on a unix datagram socket; each datagram is one
+utterance. Hooks hand off a message with a single sendto and return.
+
+Only one daemon runs at a time (flock guard). Send "__EXIT__" to stop it.
+"""
+
+import asyncio
+import fcntl
+import os
+import signal
+import socket
+import sys
+from pathlib import Path
+
+# Import sibling TTS modules and the shared spawn helper
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from cached_tts import speak_with_cache, play_audio
+from runtime import ensure_runtime_dir, get_runtime_dir
+from spawn import spawn_detached
+
+# Long-lived audio worker: one fork at daemon startup instead of a player
+# fork+exec per utterance. It reads file paths line by line and tries the
+# same player chain play_audio uses.
+_player = None
+
+_PLAYER_LOOP = (
+    'while IFS= read -r f; do '
+    'afplay "$f" 2>/dev/null || mpg123 -q "$f" 2>/dev/null || '
+    'ffplay -nodisp -autoexit -loglevel quiet "$f" 2>/dev/null; '
+    'done'
+)
+
+
+def _get_player():
+    """The persistent player coprocess, respawned if it died."""
+    global _player
+    if _player is None or _player.poll() is not None:
+        import subprocess
+        _player = subprocess.Popen(
+            ['sh', '-c', _PLAYER_LOOP],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+    return _player
+
+
+def play_via_worker(audio_file):
+    """Queue a file on the persistent player; False to use the spawn path."""
+    try:
+        player = _get_player()
+        player.stdin.write(f"{audio_file}\n")
+        player.stdin.flush()
+        return True
+    except OSError:
+        return False
+
+
+# Message -> cached audio path for the known message set, computed once at
+# startup so a hit skips the per-utterance hash, path build and exists()
+_audio_map = {}
+
+
+def build_audio_map():
+    """Precompute cached audio paths for all known messages.
+
+    One scandir of the voice cache dir replaces a stat() per message; a
+    message missing from the scan simply falls back to speak_with_cache,
+    which regenerates (and lazily migrates) as needed.
+    """
+    try:
+        from messages import get_all_messages
+        from cached_tts import get_cache_dir, get_cache_key
+    except ImportError:
+        return
+
+    cache_dir = get_cache_dir()
+    try:
+        with os.scandir(cache_dir) as entries:
+            cached_names = {entry.name for entry in entries}
+    except OSError:
+        return  # No cache dir yet; everything takes the fallback path
+
+    for message in get_all_messages():
+        filename = f"{get_cache_key(message)}.mp3"
+        if filename in cached_names:
+            _audio_map[message] = cache_dir / filename
+
+# Hook-start beep assets (see response_summary.play_start_notification)
+NOTIFY_SOUND = '/usr/share/sounds/freedesktop/stereo/message-new-instant.oga'
+NOTIFY_WAV = Path.home() / '.cache' / 'claude-speaks' / 'notify.wav'
+
+
+def play_beep():
+    """Play the hook-start beep; the fork happens here, not in the hook."""
+    if NOTIFY_WAV.exists():
+        spawn_detached(['aplay', '-q', str(NOTIFY_WAV)])
+    else:
+        spawn_detached(['paplay', NOTIFY_SOUND])
+
+
+def get_socket_path():
+    return get_runtime_dir() / 'tts.sock'
+
+
+def main():
+    runtime_dir = ensure_runtime_dir()
+
+    # Single-instance guard: hold the lock for the daemon's lifetime
+    lock_fd = open(runtime_dir / 'tts_daemon.lock', 'w')
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except (IOError, OSError):
+        return 0  # Another daemon is already running
+
+    socket_path = get_socket_path()
+    try:
+        os.unlink(socket_path)
+    except OSError:
+        pass  # No stale socket to remove
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    sock.bind(str(socket_path))
+    os.chmod(socket_path, 0o600)
+    sock.setblocking(False)
+
+    build_audio_map()
+
+    try:
+        asyncio.run(_serve(sock))
+    finally:
+        sock.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+    return 0
+
+
+async def _handle_message(data, shutdown_event):
+    """Dispatch one datagram; uncached speech runs on a thread so a slow
+    utterance never blocks the next one."""
+    text = data.decode('utf-8', errors='replace').strip()
+    if not text:
+        return
+    if text == '__EXIT__':
+        shutdown_event.set()
+        return
+    try:
+        if text == '__BEEP__':
+            play_beep()
+        elif text in _audio_map:
+            # Known message with a warm cache entry: hand the file to the
+            # persistent player (no fork on this path)
+            audio_file = _audio_map[text]
+            if not play_via_worker(audio_file):
+                play_audio(audio_file)
+        else:
+            await asyncio.to_thread(speak_with_cache, text)
+    except Exception:
+        pass  # A bad utterance must not kill the daemon
+
+
+class _DatagramHandler(asyncio.DatagramProtocol):
+    """Schedules one task per datagram so messages process concurrently."""
+
+    def __init__(self, shutdown_event):
+        self.shutdown_event = shutdown_event
+        self.tasks = set()
+
+    def datagram_received(self, data, addr):
+        task = asyncio.get_running_loop().create_task(
+            _handle_message(data, self.shutdown_event))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+
+
+async def _serve(sock):
+    """Event loop: datagrams and termination signals are both wake sources."""
+    loop = asyncio.get_running_loop()
+    shutdown_event = asyncio.Event()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, shutdown_event.set)
+
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _DatagramHandler(shutdown_event), sock=sock)
+    try:
+        await shutdown_event.wait()
+    finally:
+        transport.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
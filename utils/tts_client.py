@@ -0,0 +1,46 @@
+"""
+Client side of the persistent TTS daemon (see tts/tts_daemon.py).
+
+A hook that finds the daemon's socket hands the utterance off with one
+sendto - no fork, no exec, no interpreter startup on the hot path. When
+the daemon isn't up yet, callers fall back to spawning the TTS script
+directly and start the daemon for next time.
+"""
+
+import socket
+from pathlib import Path
+
+from runtime import get_runtime_dir
+from spawn import spawn_detached
+
+TTS_DAEMON_SCRIPT = str(Path(__file__).parent / "tts" / "tts_daemon.py")
+
+
+def get_socket_path():
+    """The daemon's socket path."""
+    return get_runtime_dir() / 'tts.sock'
+
+
+def send_to_tts_daemon(message):
+    """Hand one utterance to the daemon.
+
+    Returns:
+        bool: True if the daemon accepted the datagram, False if it isn't
+            running (caller should fall back to a direct spawn)
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    try:
+        sock.sendto(message.encode('utf-8'), str(get_socket_path()))
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.close()
+
+
+def start_tts_daemon():
+    """Spawn the daemon detached so future hooks get the warm path."""
+    try:
+        spawn_detached([TTS_DAEMON_SCRIPT])
+    except OSError:
+        pass  # No daemon; direct spawns keep working
@@ -0,0 +1,134 @@
+"""
+Shared TTS script path resolution with on-disk memoization.
+
+Resolving the TTS script normally costs 3-4 Path.exists() syscalls plus env
+lookups per hook invocation. Since hooks fire many times per session, the
+result is cached in ~/.cache/claude-speaks/tts_path.json keyed by the tts
+directory mtime and which API keys are present, so repeat invocations skip
+the filesystem scan entirely.
+"""
+
+import json
+import os
+from pathlib import Path
+
+TTS_DIR = Path(__file__).parent / "tts"
+CACHE_FILE = Path.home() / ".cache" / "claude-speaks" / "tts_path.json"
+
+# Candidate script paths precomputed once; os.path.exists on a plain string
+# skips the per-call Path object construction
+_CACHED_TTS = str(TTS_DIR / "cached_tts.py")
+_ELEVENLABS_TTS = str(TTS_DIR / "elevenlabs_tts.py")
+_OPENAI_TTS = str(TTS_DIR / "openai_tts.py")
+_SYSTEM_VOICE_TTS = str(TTS_DIR / "system_voice_tts.py")
+
+
+# Pre-built interpreter for the TTS scripts. After the one-time bootstrap
+# (uv venv .tts-venv && uv pip install python-dotenv requests openai) the
+# scripts run under this interpreter directly, skipping the per-invocation
+# dependency resolution their `uv run` shebang pays.
+TTS_VENV_PYTHON = str(Path(__file__).parent.parent / ".tts-venv" / "bin" / "python")
+
+
+def tts_argv(tts_script, *args):
+    """Build the argv for invoking a TTS script.
+
+    Prefers the prebuilt venv interpreter when the bootstrap has been run;
+    otherwise execs the script via its shebang.
+    """
+    if os.path.exists(TTS_VENV_PYTHON):
+        return [TTS_VENV_PYTHON, tts_script, *args]
+    return [tts_script, *args]
+
+
+def _cache_key():
+    """Build the cache invalidation key: tts dir mtime + API key presence."""
+    try:
+        mtime_ns = TTS_DIR.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return [
+        mtime_ns,
+        bool(os.getenv('ELEVENLABS_API_KEY')),
+        bool(os.getenv('OPENAI_API_KEY')),
+    ]
+
+
+def _scan_tts_script(prefer_cached):
+    """Resolve the TTS script by probing the filesystem (the original logic).
+
+    Args:
+        prefer_cached: If True, prefer the cached_tts.py wrapper and fall back
+            ElevenLabs > OpenAI (hook notification/completion priority). If
+            False, skip the cache wrapper and prefer OpenAI > ElevenLabs
+            (response summary priority).
+
+    Returns:
+        str or None: Path to the TTS script to invoke
+    """
+    if prefer_cached:
+        # Use cached TTS wrapper (supports all TTS backends with caching)
+        if os.path.exists(_CACHED_TTS):
+            return _CACHED_TTS
+
+        # Fallback to non-cached scripts if cached_tts doesn't exist
+        backends = (('ELEVENLABS_API_KEY', _ELEVENLABS_TTS),
+                    ('OPENAI_API_KEY', _OPENAI_TTS))
+    else:
+        # Summaries are dynamic and not cached; OpenAI is fastest and cheapest
+        backends = (('OPENAI_API_KEY', _OPENAI_TTS),
+                    ('ELEVENLABS_API_KEY', _ELEVENLABS_TTS))
+
+    for api_key_env, script in backends:
+        if os.getenv(api_key_env) and os.path.exists(script):
+            return script
+
+    # Fall back to system voice (no API key required)
+    if os.path.exists(_SYSTEM_VOICE_TTS):
+        return _SYSTEM_VOICE_TTS
+
+    return None
+
+
+def resolve_tts_script(prefer_cached=True):
+    """Get the TTS script path, using the on-disk cache when valid.
+
+    On a cache hit no exists() probing happens at all. On a miss the
+    filesystem scan runs and the result is written back atomically.
+
+    Args:
+        prefer_cached: Passed through to the scan (see _scan_tts_script)
+
+    Returns:
+        str or None: Path to the TTS script to invoke
+    """
+    variant = 'cached' if prefer_cached else 'direct'
+    key = _cache_key()
+
+    data = None
+    try:
+        with open(CACHE_FILE) as f:
+            data = json.load(f)
+        if data.get('key') == key and variant in data.get('paths', {}):
+            return data['paths'][variant]
+    except (OSError, ValueError, AttributeError):
+        data = None
+
+    # Cache miss: re-scan and write back atomically via os.replace
+    path = _scan_tts_script(prefer_cached)
+
+    paths = {}
+    if isinstance(data, dict) and data.get('key') == key:
+        paths = dict(data.get('paths', {}))
+    paths[variant] = path
+
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = CACHE_FILE.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump({'key': key, 'paths': paths}, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        pass  # Cache write failure is non-critical
+
+    return path